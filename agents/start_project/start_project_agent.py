@@ -2,14 +2,54 @@
 """Agente para iniciar el proyecto siguiendo INICIO_RAPIDO.md"""
 
 import argparse
+import asyncio
+import re
 import sys
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Agregar el directorio shared al path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.config_loader import ConfigLoader
-from shared.utils import setup_logging, run_command, check_docker_running
+from shared.config_loader import get_config, get_project_root
+from shared.utils import setup_logging, flush_logging, run_command, run_command_async, check_docker_running
+
+
+_LOG = setup_logging()
+
+# Marcadores de las líneas relevantes en la salida de 'make lite-status'
+STATUS_TOKENS = ('✅', '❌', 'Status')
+
+# Objetivos de make iniciados con una sola invocación, en orden. make se
+# detiene en el primero que falle, así que los frontends no se inician si
+# falla el backend
+START_TARGETS = ("lite-start", "frontend-all")
+
+# Objetivo en el que falló make: "*** [lite-start] Error 1" (o, en GNU make 4,
+# "*** [Makefile:12: lite-start] Error 1") si falla su receta, y
+# "No rule to make target 'x', needed by 'frontend-all'" si no existe
+MAKE_FAILED_TARGET_RE = re.compile(
+    r"\*\*\* \[(?:[^\]]*:\d+: )?(?P<recipe>[^\]]+)\] Error"
+    r"|No rule to make target [`'](?P<missing>[^`']+)'(?:, needed by [`'](?P<needed>[^`']+)')?"
+)
+
+
+def _failed_make_target(stderr: str) -> Optional[str]:
+    """
+    Obtiene el objetivo de START_TARGETS en el que se detuvo make.
+    
+    Args:
+        stderr: Salida de error de make
+        
+    Returns:
+        Objetivo fallido, o None si la salida no nombra ninguno de
+        START_TARGETS (p. ej. falló una dependencia de alguno de ellos)
+    """
+    for match in MAKE_FAILED_TARGET_RE.finditer(stderr or ""):
+        target = (match.group("needed") or match.group("recipe") or match.group("missing")).strip()
+        if target in START_TARGETS:
+            return target
+    return None
 
 
 class StartProjectAgent:
@@ -17,9 +57,9 @@ class StartProjectAgent:
     
     def __init__(self):
         """Inicializa el agente."""
-        self.logger = setup_logging()
-        self.config = ConfigLoader()
-        self.project_root = self.config.get_project_root()
+        self.logger = _LOG
+        self.config = get_config()
+        self.project_root = get_project_root()
         self.inicio_rapido_path = self.project_root / "INICIO_RAPIDO.md"
     
     def verify_inicio_rapido_exists(self) -> bool:
@@ -56,14 +96,20 @@ class StartProjectAgent:
                 )
                 if returncode == 0:
                     self.logger.info("Docker Desktop iniciado. Esperando que esté listo...")
-                    # Esperar hasta 60 segundos
+                    # Esperar hasta 60 segundos con backoff exponencial (100 ms -> 2 s)
                     import time
-                    for i in range(30):
-                        time.sleep(2)
+                    start = time.monotonic()
+                    deadline = start + 60
+                    delay = 0.1
+                    while True:
                         if check_docker_running():
                             self.logger.info("Docker está listo")
                             return True
-                        self.logger.debug(f"Esperando Docker... ({i*2} segundos)")
+                        if time.monotonic() >= deadline:
+                            break
+                        self.logger.debug(f"Esperando Docker... ({time.monotonic() - start:.1f} segundos)")
+                        time.sleep(delay)
+                        delay = min(delay * 1.5, 2.0)
                     self.logger.warning("Docker no respondió en 60 segundos")
                     return False
             else:
@@ -77,17 +123,29 @@ class StartProjectAgent:
         """
         Inicia el backend con make lite-start.
         
+        Returns:
+            True si se inició correctamente, False en caso contrario
+        """
+        return asyncio.run(self.start_backend_async())
+    
+    async def start_backend_async(self) -> bool:
+        """
+        Versión asíncrona de start_backend.
+        
         Returns:
             True si se inició correctamente, False en caso contrario
         """
         self.logger.info("Iniciando backend con 'make lite-start'...")
-        returncode, stdout, stderr = run_command(
+        returncode, stdout, stderr = await run_command_async(
             ["make", "lite-start"],
             cwd=self.project_root,
             check=False,
             capture_output=True
         )
-        
+        return self._handle_backend_result(returncode, stdout, stderr)
+    
+    def _handle_backend_result(self, returncode: int, stdout: str, stderr: str) -> bool:
+        """Procesa el resultado de 'make lite-start'."""
         if returncode == 0:
             self.logger.info("Backend iniciado correctamente")
             if stdout:
@@ -101,44 +159,110 @@ class StartProjectAgent:
         """
         Verifica el estado de los servicios con make lite-status.
         
+        Returns:
+            True si los servicios están funcionando, False en caso contrario
+        """
+        return asyncio.run(self.check_status_async())
+    
+    async def check_status_async(self) -> bool:
+        """
+        Versión asíncrona de check_status.
+        
         Returns:
             True si los servicios están funcionando, False en caso contrario
         """
         self.logger.info("Verificando estado de servicios...")
-        returncode, stdout, stderr = run_command(
+        returncode, stdout, stderr = await run_command_async(
             ["make", "lite-status"],
             cwd=self.project_root,
             check=False,
             capture_output=True
         )
-        
+        return self._handle_status_result(returncode, stdout, stderr)
+    
+    def _handle_status_result(self, returncode: int, stdout: str, stderr: str) -> bool:
+        """Procesa el resultado de 'make lite-status'."""
         if returncode == 0:
             self.logger.info("Estado de servicios:")
-            if stdout:
-                # Mostrar solo las líneas importantes
-                for line in stdout.split('\n'):
-                    if '✅' in line or '❌' in line or 'Status' in line:
-                        self.logger.info(line)
+            self._log_status_lines(stdout)
             return True
         else:
             self.logger.warning(f"Error al verificar estado: {stderr}")
             return False
     
+    def _log_status_lines(self, stdout: str) -> None:
+        """Muestra solo las líneas importantes de la salida de 'make lite-status'."""
+        # Descartar la salida completa sin partirla si no hay nada relevante
+        if not stdout or not any(token in stdout for token in STATUS_TOKENS):
+            return
+        for line in stdout.splitlines():
+            if any(token in line for token in STATUS_TOKENS):
+                self.logger.info(line)
+    
+    async def start_all_async(self) -> Tuple[bool, bool]:
+        """
+        Inicia backend y frontends con una sola invocación de make.
+        
+        Evita lanzar un proceso make por paso. make procesa los objetivos en
+        orden y se detiene en el primero que falle, por lo que los frontends
+        solo se inician con el backend funcionando. Si make falla sin nombrar
+        el objetivo, el backend no se da por caído y se informa del error
+        como fallo de los frontends.
+        
+        Returns:
+            Tupla (backend_ok, frontends_ok)
+        """
+        self.logger.info(f"Iniciando backend y frontends con 'make {' '.join(START_TARGETS)}'...")
+        returncode, stdout, stderr = await run_command_async(
+            ["make", *START_TARGETS],
+            cwd=self.project_root,
+            check=False,
+            capture_tmpfile=True
+        )
+        
+        if returncode == 0:
+            self._handle_backend_result(0, stdout, stderr)
+            return True, self._handle_frontends_result(0, "", stderr)
+        
+        failed = _failed_make_target(stderr)
+        if failed == "lite-start":
+            return self._handle_backend_result(returncode, stdout, stderr), False
+        if failed is None:
+            # Falló una dependencia sin nombre conocido: no se sabe si el
+            # backend llegó a iniciarse, así que no se da por caído; la
+            # verificación de estado posterior muestra si responde
+            self.logger.warning(f"Error en 'make {' '.join(START_TARGETS)}': {stderr}")
+            return True, False
+        self.logger.info("Backend iniciado correctamente")
+        return True, self._handle_frontends_result(returncode, "", stderr)
+    
     def start_frontends(self) -> bool:
         """
         Inicia los frontends con make frontend-all.
         
+        Returns:
+            True si se inició correctamente, False en caso contrario
+        """
+        return asyncio.run(self.start_frontends_async())
+    
+    async def start_frontends_async(self) -> bool:
+        """
+        Versión asíncrona de start_frontends.
+        
         Returns:
             True si se inició correctamente, False en caso contrario
         """
         self.logger.info("Iniciando frontends con 'make frontend-all'...")
-        returncode, stdout, stderr = run_command(
+        returncode, stdout, stderr = await run_command_async(
             ["make", "frontend-all"],
             cwd=self.project_root,
             check=False,
-            capture_output=True
+            capture_tmpfile=True
         )
-        
+        return self._handle_frontends_result(returncode, stdout, stderr)
+    
+    def _handle_frontends_result(self, returncode: int, stdout: str, stderr: str) -> bool:
+        """Procesa el resultado de 'make frontend-all'."""
         if returncode == 0:
             self.logger.info("Frontends iniciados correctamente")
             if stdout:
@@ -177,7 +301,8 @@ class StartProjectAgent:
             self.logger.warning(f"Error al iniciar documentación: {stderr}")
             return False
     
-    def run(self, start_frontends: bool = True, start_docs: bool = True) -> bool:
+    def run(self, start_frontends: bool = True, start_docs: bool = True,
+            step_by_step: bool = False) -> bool:
         """
         Ejecuta la secuencia completa de inicio del proyecto.
         Por defecto inicia los frontends y documentación siguiendo INICIO_RAPIDO.md.
@@ -185,6 +310,36 @@ class StartProjectAgent:
         Args:
             start_frontends: Si es True, también inicia los frontends (por defecto: True)
             start_docs: Si es True, también inicia la documentación (por defecto: True)
+            step_by_step: Si es True, ejecuta cada objetivo de make por separado
+            
+        Returns:
+            True si todo se ejecutó correctamente, False en caso contrario
+        """
+        try:
+            return asyncio.run(self.run_async(
+                start_frontends=start_frontends,
+                start_docs=start_docs,
+                step_by_step=step_by_step
+            ))
+        finally:
+            # El log se escribe en bloque: volcarlo antes de devolver el control
+            flush_logging()
+    
+    async def run_async(self, start_frontends: bool = True, start_docs: bool = True,
+                        step_by_step: bool = False) -> bool:
+        """
+        Versión asíncrona de run.
+        
+        Con la secuencia completa, backend y frontends se inician con una sola
+        invocación de make y después se verifica el estado. En el modo paso a
+        paso, la verificación de estado se solapa con el inicio de los
+        frontends, ya que ambos pasos son independientes una vez iniciado el
+        backend.
+        
+        Args:
+            start_frontends: Si es True, también inicia los frontends (por defecto: True)
+            start_docs: Si es True, también inicia la documentación (por defecto: True)
+            step_by_step: Si es True, ejecuta cada objetivo de make por separado
             
         Returns:
             True si todo se ejecutó correctamente, False en caso contrario
@@ -202,21 +357,35 @@ class StartProjectAgent:
             self.logger.error("Docker no está disponible. Por favor, inicia Docker Desktop manualmente.")
             return False
         
-        # 3. Iniciar backend
-        if not self.start_backend():
-            return False
+        # 3 y 5. Iniciar backend y frontends con un solo make
+        if start_frontends and not step_by_step:
+            backend_ok, frontends_ok = await self.start_all_async()
+            if not backend_ok:
+                return False
+            # 4. Verificar estado, con su propia salida
+            status_ok = await self.check_status_async()
+        else:
+            # 3. Iniciar backend
+            if not await self.start_backend_async():
+                return False
+            
+            # 4. Verificar estado y 5. iniciar frontends (por defecto, siguiendo
+            # INICIO_RAPIDO.md paso 4) en paralelo
+            if start_frontends:
+                self.logger.info("Iniciando frontends (paso 4 de INICIO_RAPIDO.md)...")
+                status_ok, frontends_ok = await asyncio.gather(
+                    self.check_status_async(),
+                    self.start_frontends_async()
+                )
+            else:
+                status_ok = await self.check_status_async()
+                frontends_ok = True
+                self.logger.info("Omitiendo inicio de frontends")
         
-        # 4. Verificar estado
-        if not self.check_status():
+        if not status_ok:
             self.logger.warning("Algunos servicios pueden no estar funcionando correctamente")
-        
-        # 5. Iniciar frontends (por defecto, siguiendo INICIO_RAPIDO.md paso 4)
-        if start_frontends:
-            self.logger.info("Iniciando frontends (paso 4 de INICIO_RAPIDO.md)...")
-            if not self.start_frontends():
-                self.logger.warning("Error al iniciar frontends, pero el backend está funcionando")
-        else:
-            self.logger.info("Omitiendo inicio de frontends")
+        if not frontends_ok:
+            self.logger.warning("Error al iniciar frontends, pero el backend está funcionando")
         
         # 6. Iniciar documentación (opcional)
         if start_docs:
@@ -248,6 +417,11 @@ def main():
         action="store_true",
         help="NO inicia la documentación (por defecto la inicia)"
     )
+    parser.add_argument(
+        "--step",
+        action="store_true",
+        help="Ejecuta cada objetivo de make por separado (por defecto usa una sola invocación)"
+    )
     
     args = parser.parse_args()
     
@@ -255,7 +429,8 @@ def main():
     # Por defecto inicia frontends y docs, a menos que se pasen los flags correspondientes
     success = agent.run(
         start_frontends=not args.no_frontends,
-        start_docs=not args.no_docs
+        start_docs=not args.no_docs,
+        step_by_step=args.step
     )
     
     sys.exit(0 if success else 1)
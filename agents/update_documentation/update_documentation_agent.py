@@ -2,16 +2,62 @@
 """Agente para actualizar documentación del proyecto."""
 
 import argparse
+import asyncio
+import fnmatch
 import json
+import os
+import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson es opcional: si no está instalado se usa el módulo json estándar
+    orjson = None
 
 # Agregar el directorio shared al path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.config_loader import ConfigLoader
-from shared.utils import setup_logging, run_command, find_files
+from shared.config_loader import get_config, get_project_root
+from shared.utils import setup_logging, flush_logging, run_command_async, iter_files, ensure_dir, SKIP_DIRS
+
+
+_LOG = setup_logging()
+
+# Nombres de collections (no environments), evaluados en una sola pasada
+COLLECTION_NAME_RE = re.compile(r"^(?!.*environment).*collection", re.IGNORECASE)
+
+# Máximo de collections leídas y validadas en paralelo
+MAX_PARSE_WORKERS = 8
+
+# Buffer de escritura de la collection combinada (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+COMBINED_COLLECTION_INFO = {
+    "name": "SaaS - Microservices API Collection",
+    "description": "Colección combinada de todos los endpoints de los servicios",
+    "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
+    "version": "1.0.0"
+}
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parsea JSON usando orjson si está disponible."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serializa a JSON indentado (UTF-8) usando orjson si está disponible."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
 
 
 class UpdateDocumentationAgent:
@@ -19,12 +65,63 @@ class UpdateDocumentationAgent:
     
     def __init__(self):
         """Inicializa el agente."""
-        self.logger = setup_logging()
-        self.config = ConfigLoader()
-        self.project_root = self.config.get_project_root()
+        self.logger = _LOG
+        self.config = get_config()
+        self.project_root = get_project_root()
         self.services_dir = self.project_root / "services"
         self.docs_dir = self.project_root / "services" / "saas-mt-docs"
         self.combined_collection_path = self.project_root / "combined-services-postman-collection.json"
+        self.validation_cache_path = self.project_root / ".cache" / "docvalidate.json"
+        self._services_scan: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    def _scan_services(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Recorre el directorio de servicios una sola vez y guarda el resultado.
+        
+        Cada servicio se recorre desde su propio path, de modo que también se
+        siguen los servicios que son enlaces simbólicos. Omite directorios sin
+        documentación (node_modules, .git, dist, etc.).
+        
+        Returns:
+            Diccionario nombre de servicio -> {path, readme_exists,
+            docs_dir_exists, postman_paths}
+        """
+        if self._services_scan is not None:
+            return self._services_scan
+        
+        services: Dict[str, Dict[str, Any]] = {}
+        try:
+            with os.scandir(self.services_dir) as it:
+                service_names = [e.name for e in it if e.is_dir() and e.name not in SKIP_DIRS]
+        except OSError:
+            service_names = []
+        
+        for name in service_names:
+            service_path = self.services_dir / name
+            service = {
+                "path": service_path,
+                "readme_exists": False,
+                "docs_dir_exists": False,
+                "postman_paths": []
+            }
+            services[name] = service
+            
+            # os.walk lista la raíz aunque sea un enlace simbólico
+            for dirpath, dirnames, filenames in os.walk(service_path, topdown=True):
+                dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+                current = Path(dirpath)
+                if current == service_path:
+                    service["readme_exists"] = "README.md" in filenames
+                    service["docs_dir_exists"] = any(
+                        d in dirnames or d in filenames for d in ("docs", "documentation")
+                    )
+                
+                for filename in filenames:
+                    if fnmatch.fnmatchcase(filename, "*postman*.json"):
+                        service["postman_paths"].append(current / filename)
+        
+        self._services_scan = services
+        return services
     
     def find_postman_collections(self) -> List[Path]:
         """
@@ -34,13 +131,12 @@ class UpdateDocumentationAgent:
             Lista de paths a las collections encontradas
         """
         self.logger.info("Buscando collections de Postman...")
-        collections = find_files("*postman*.json", self.services_dir)
+        collections = [
+            p for service in self._scan_services().values() for p in service["postman_paths"]
+        ]
         
         # Filtrar solo collections (no environments)
-        postman_collections = [
-            p for p in collections 
-            if "collection" in p.name.lower() and "environment" not in p.name.lower()
-        ]
+        postman_collections = [p for p in collections if COLLECTION_NAME_RE.search(p.name)]
         
         self.logger.info(f"Encontradas {len(postman_collections)} collections:")
         for col in postman_collections:
@@ -48,84 +144,141 @@ class UpdateDocumentationAgent:
         
         return postman_collections
     
-    def validate_postman_collection(self, collection_path: Path) -> bool:
+    def _parse_collection(self, collection_path: Path) -> Optional[Dict[str, Any]]:
         """
-        Valida que un archivo de collection de Postman tenga la estructura correcta.
+        Lee y valida una collection de Postman en una sola pasada.
         
         Args:
             collection_path: Path al archivo de collection
             
         Returns:
-            True si es válida, False en caso contrario
+            Diccionario con la collection si es válida, None en caso contrario
         """
         try:
-            with open(collection_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(collection_path, 'rb') as f:
+                data = _json_loads(f.read())
             
             # Validar estructura básica
             if "info" not in data:
                 self.logger.error(f"{collection_path.name}: Falta campo 'info'")
-                return False
+                return None
             
             if "item" not in data:
                 self.logger.error(f"{collection_path.name}: Falta campo 'item'")
-                return False
+                return None
             
             self.logger.debug(f"{collection_path.name}: Estructura válida")
-            return True
+            return data
         
         except json.JSONDecodeError as e:
             self.logger.error(f"{collection_path.name}: Error de JSON: {e}")
-            return False
+            return None
         except Exception as e:
             self.logger.error(f"{collection_path.name}: Error al validar: {e}")
-            return False
+            return None
     
-    def merge_postman_collections(self, collections: List[Path]) -> Dict[str, Any]:
+    def validate_postman_collection(self, collection_path: Path) -> bool:
         """
-        Combina múltiples collections de Postman en una sola.
+        Valida que un archivo de collection de Postman tenga la estructura correcta.
         
         Args:
-            collections: Lista de paths a las collections
+            collection_path: Path al archivo de collection
             
         Returns:
-            Diccionario con la collection combinada
+            True si es válida, False en caso contrario
         """
-        self.logger.info("Combinando collections de Postman...")
+        return self._parse_collection(collection_path) is not None
+    
+    def _load_and_validate(self, collection_path: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Lee y valida una collection abriendo el archivo una sola vez.
         
-        combined = {
-            "info": {
-                "name": "SaaS - Microservices API Collection",
-                "description": "Colección combinada de todos los endpoints de los servicios",
-                "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
-                "version": "1.0.0"
-            },
-            "item": []
+        Args:
+            collection_path: Path al archivo de collection
+            
+        Returns:
+            Tupla (nombre del servicio, item del servicio) o None si es inválida
+        """
+        data = self._parse_collection(collection_path)
+        if data is None:
+            return None
+        
+        service_name = collection_path.parent.name
+        service_item = {
+            "name": service_name,
+            "description": data.get("info", {}).get("description", f"Endpoints de {service_name}"),
+            "item": data.get("item", [])
         }
+        return service_name, service_item
+    
+    def _iter_service_items(self, collections: List[Path]) -> Iterator[Dict[str, Any]]:
+        """
+        Genera los items por servicio de las collections válidas, en orden.
         
-        for collection_path in collections:
-            if not self.validate_postman_collection(collection_path):
-                self.logger.warning(f"Omitiendo collection inválida: {collection_path.name}")
-                continue
+        Args:
+            collections: Lista de paths a las collections
             
-            try:
-                with open(collection_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        Yields:
+            Item de la collection combinada correspondiente a cada servicio
+        """
+        if not collections:
+            return
+        
+        # Leer y validar en paralelo: el tiempo está dominado por la E/S de disco.
+        # Solo hay max_workers lecturas en curso a la vez, para que los hilos no
+        # adelanten al consumidor y acumulen todas las collections en memoria
+        max_workers = min(MAX_PARSE_WORKERS, len(collections))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            paths = iter(collections)
+            in_flight = deque(
+                (path, executor.submit(self._load_and_validate, path))
+                for path in islice(paths, max_workers)
+            )
+            while in_flight:
+                collection_path, future = in_flight.popleft()
+                result = future.result()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    in_flight.append((next_path, executor.submit(self._load_and_validate, next_path)))
                 
-                service_name = collection_path.parent.name
-                service_item = {
-                    "name": service_name,
-                    "description": data.get("info", {}).get("description", f"Endpoints de {service_name}"),
-                    "item": data.get("item", [])
-                }
+                if result is None:
+                    self.logger.warning(f"Omitiendo collection inválida: {collection_path.name}")
+                    continue
                 
-                combined["item"].append(service_item)
+                service_name, service_item = result
+                yield service_item
                 self.logger.info(f"Agregada collection de {service_name}")
-            
-            except Exception as e:
-                self.logger.error(f"Error al procesar {collection_path.name}: {e}")
+    
+    def write_combined_collection(self, collections: List[Path]) -> None:
+        """
+        Escribe la collection combinada servicio por servicio.
         
-        return combined
+        Evita construir la collection completa en memoria: cada item se
+        serializa y se libera en cuanto se escribe, y como mucho hay
+        MAX_PARSE_WORKERS collections más leídas por adelantado. El resultado
+        es idéntico al de serializar la collection combinada completa con
+        indent=2.
+        
+        Args:
+            collections: Lista de paths a las collections
+        """
+        self.logger.info("Combinando collections de Postman...")
+        
+        # Cada fragmento se serializa completo a bytes y se escribe con una sola
+        # llamada; el buffer grande agrupa los fragmentos en pocas syscalls
+        with open(self.combined_collection_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(
+                b'{\n  "info": '
+                + _json_dumps(COMBINED_COLLECTION_INFO).replace(b"\n", b"\n  ")
+                + b',\n  "item": ['
+            )
+            has_items = False
+            for service_item in self._iter_service_items(collections):
+                separator = b",\n    " if has_items else b"\n    "
+                f.write(separator + _json_dumps(service_item).replace(b"\n", b"\n    "))
+                has_items = True
+            # Una lista vacía se serializa como "[]"
+            f.write(b"\n  ]\n}" if has_items else b"]\n}")
     
     def update_postman_collection(self) -> bool:
         """
@@ -141,11 +294,8 @@ class UpdateDocumentationAgent:
             self.logger.warning("No se encontraron collections de Postman")
             return False
         
-        combined = self.merge_postman_collections(collections)
-        
         try:
-            with open(self.combined_collection_path, 'w', encoding='utf-8') as f:
-                json.dump(combined, f, indent=2, ensure_ascii=False)
+            self.write_combined_collection(collections)
             
             self.logger.info(f"Collection combinada actualizada: {self.combined_collection_path}")
             return True
@@ -164,6 +314,19 @@ class UpdateDocumentationAgent:
         Returns:
             Diccionario con el resultado de la validación
         """
+        return self._validate_service(service_path)[0]
+    
+    def _validate_service(self, service_path: Path) -> Tuple[Dict[str, Any], Optional[Path]]:
+        """
+        Valida la documentación de un servicio.
+        
+        Args:
+            service_path: Path al directorio del servicio
+            
+        Returns:
+            Tupla (resultado de la validación, path de la collection de Postman
+            encontrada o None)
+        """
         service_name = service_path.name
         result = {
             "service": service_name,
@@ -173,79 +336,200 @@ class UpdateDocumentationAgent:
             "issues": []
         }
         
+        # Reutilizar el recorrido de services/ si el servicio está en él
+        scanned = (self._services_scan or {}).get(service_name)
+        if scanned is not None and scanned["path"] == service_path:
+            result["readme_exists"] = scanned["readme_exists"]
+            result["docs_dir_exists"] = scanned["docs_dir_exists"]
+            collection = next(
+                (p for p in scanned["postman_paths"]
+                 if fnmatch.fnmatchcase(p.name, "*postman*collection*.json")),
+                None
+            )
+            result["postman_collection_exists"] = collection is not None
+            if not result["readme_exists"]:
+                result["issues"].append("README.md no encontrado")
+            return result, collection
+        
+        # Listar el directorio una sola vez para todas las comprobaciones
+        try:
+            with os.scandir(service_path) as it:
+                entries = {e.name for e in it}
+        except OSError:
+            entries = set()
+        
         # Verificar README.md
-        readme_path = service_path / "README.md"
-        if readme_path.exists():
+        if "README.md" in entries:
             result["readme_exists"] = True
         else:
             result["issues"].append("README.md no encontrado")
         
         # Verificar directorio de documentación
-        docs_dirs = ["docs", "documentation"]
-        for docs_dir in docs_dirs:
-            if (service_path / docs_dir).exists():
-                result["docs_dir_exists"] = True
-                break
-        
-        # Verificar collection de Postman
-        postman_collections = find_files("*postman*collection*.json", service_path)
-        if postman_collections:
-            result["postman_collection_exists"] = True
-        
-        return result
+        result["docs_dir_exists"] = "docs" in entries or "documentation" in entries
+        
+        # Verificar collection de Postman: primero en la raíz del servicio y
+        # solo si no está ahí, recorrer el resto del árbol
+        pattern = "*postman*collection*.json"
+        collection = next((service_path / name for name in entries
+                           if fnmatch.fnmatchcase(name, pattern)), None)
+        if collection is None:
+            found = next(iter_files(pattern, service_path), None)
+            collection = Path(found) if found is not None else None
+        result["postman_collection_exists"] = collection is not None
+        
+        return result, collection
     
-    def validate_all_documentation(self) -> List[Dict[str, Any]]:
+    def validate_all_documentation(self) -> Tuple[List[Dict[str, Any]], int]:
         """
         Valida la documentación de todos los servicios.
         
         Returns:
-            Lista de resultados de validación
+            Tupla con (lista de resultados de validación, total de problemas)
         """
         self.logger.info("Validando documentación de servicios...")
         
         results = []
+        total_issues = 0
         if not self.services_dir.exists():
             self.logger.error(f"Directorio de servicios no encontrado: {self.services_dir}")
-            return results
-        
-        for service_path in self.services_dir.iterdir():
-            if not service_path.is_dir() or service_path.name.startswith('.'):
-                continue
-            
-            result = self.validate_service_documentation(service_path)
+            return results, total_issues
+        
+        cache = self._load_validation_cache()
+        new_cache = {}
+        
+        with os.scandir(self.services_dir) as it:
+            service_entries = [
+                e for e in it
+                if e.is_dir() and not e.name.startswith('.') and e.name not in SKIP_DIRS
+            ]
+        
+        for entry in service_entries:
+            # Omitir servicios sin cambios desde la última validación. Sin
+            # collection encontrada se valida siempre: podría haberse agregado
+            # en cualquier subdirectorio, y eso no cambia el mtime superficial
+            mtime_ns = self._service_mtime_ns(entry)
+            cached = cache.get(entry.name)
+            if (
+                mtime_ns is not None and cached and cached.get("postman_dir")
+                and cached.get("mtime_ns") == self._max_mtime_ns(mtime_ns, cached["postman_dir"])
+            ):
+                result = cached["result"]
+                postman_dir = cached["postman_dir"]
+            else:
+                result, collection = self._validate_service(Path(entry.path))
+                postman_dir = str(collection.parent) if collection is not None else None
+            new_cache[entry.name] = {
+                "mtime_ns": self._max_mtime_ns(mtime_ns, postman_dir),
+                "postman_dir": postman_dir,
+                "result": result
+            }
             results.append(result)
+            total_issues += len(result["issues"])
             
             if result["issues"]:
                 self.logger.warning(f"{result['service']}: {', '.join(result['issues'])}")
             else:
                 self.logger.info(f"{result['service']}: Documentación OK")
         
-        return results
+        self._save_validation_cache(new_cache)
+        return results, total_issues
     
-    def sync_docs_frontend(self) -> bool:
+    def _service_mtime_ns(self, service_entry: os.DirEntry) -> Optional[int]:
         """
-        Sincroniza la documentación con el frontend de docs.
+        Calcula la fecha de modificación de un servicio.
         
+        Es una comprobación superficial: toma el máximo entre el directorio y
+        sus entradas directas (sin ocultas), sin recorrer subdirectorios.
+        
+        Args:
+            service_entry: Entrada del directorio del servicio
+            
         Returns:
-            True si se sincronizó correctamente, False en caso contrario
+            mtime en nanosegundos o None si no se pudo calcular
         """
-        self.logger.info("Sincronizando documentación con frontend...")
+        try:
+            mtime_ns = service_entry.stat().st_mtime_ns
+            with os.scandir(service_entry.path) as it:
+                for e in it:
+                    if not e.name.startswith('.'):
+                        mtime_ns = max(mtime_ns, e.stat(follow_symlinks=False).st_mtime_ns)
+            return mtime_ns
+        except OSError as e:
+            self.logger.debug(f"No se pudo calcular mtime de {service_entry.name}: {e}")
+            return None
+    
+    def _max_mtime_ns(self, mtime_ns: Optional[int], directory: Optional[str]) -> Optional[int]:
+        """
+        Combina el mtime de un servicio con el del directorio de su collection.
         
-        sync_script = self.docs_dir / "scripts" / "sync-docs.sh"
-        if not sync_script.exists():
-            self.logger.error(f"Script de sincronización no encontrado: {sync_script}")
-            return False
+        El directorio cambia de mtime si la collection se borra o se renombra,
+        aunque esté anidado y no lo detecte la comprobación superficial.
         
-        # Hacer el script ejecutable
-        sync_script.chmod(0o755)
+        Args:
+            mtime_ns: mtime superficial del servicio (o None)
+            directory: Directorio donde se encontró la collection (o None)
+            
+        Returns:
+            mtime en nanosegundos o None si no se pudo calcular
+        """
+        if mtime_ns is None or directory is None:
+            return mtime_ns
+        try:
+            return max(mtime_ns, os.stat(directory).st_mtime_ns)
+        except OSError:
+            return None
+    
+    def _load_validation_cache(self) -> Dict[str, Any]:
+        """
+        Carga los resultados de la última validación de documentación.
         
-        returncode, stdout, stderr = run_command(
-            [str(sync_script)],
-            cwd=self.docs_dir,
-            check=False,
-            capture_output=True
-        )
+        Returns:
+            Diccionario servicio -> {mtime_ns, postman_dir, result}
+        """
+        try:
+            with open(self.validation_cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.debug(f"Caché de validación inválida: {e}")
+            return {}
+    
+    def _save_validation_cache(self, cache: Dict[str, Any]) -> None:
+        """
+        Guarda los resultados de la validación de documentación.
+        
+        Args:
+            cache: Diccionario servicio -> {mtime_ns, postman_dir, result}
+        """
+        try:
+            ensure_dir(self.validation_cache_path.parent)
+            with open(self.validation_cache_path, 'wb') as f:
+                f.write(_json_dumps(cache))
+        except Exception as e:
+            self.logger.debug(f"No se pudo guardar caché de validación: {e}")
+    
+    def _prepare_sync_script(self) -> Optional[Path]:
+        """
+        Localiza el script de sincronización y lo deja ejecutable.
         
+        Returns:
+            Path al script o None si no existe
+        """
+        sync_script = self.docs_dir / "scripts" / "sync-docs.sh"
+        try:
+            mode = sync_script.stat().st_mode
+        except FileNotFoundError:
+            self.logger.error(f"Script de sincronización no encontrado: {sync_script}")
+            return None
+        
+        # Hacer el script ejecutable solo si le faltan permisos de ejecución
+        if (mode & 0o111) != 0o111:
+            sync_script.chmod(mode | 0o755)
+        return sync_script
+    
+    def _handle_sync_result(self, returncode: int, stdout: str, stderr: str) -> bool:
+        """Procesa el resultado del script de sincronización."""
         if returncode == 0:
             self.logger.info("Documentación sincronizada correctamente")
             if stdout:
@@ -255,11 +539,69 @@ class UpdateDocumentationAgent:
             self.logger.error(f"Error al sincronizar documentación: {stderr}")
             return False
     
+    def sync_docs_frontend(self) -> bool:
+        """
+        Sincroniza la documentación con el frontend de docs.
+        
+        Returns:
+            True si se sincronizó correctamente, False en caso contrario
+        """
+        return asyncio.run(self.sync_docs_frontend_async())
+    
+    async def sync_docs_frontend_async(self) -> bool:
+        """
+        Versión asíncrona de sync_docs_frontend.
+        
+        Returns:
+            True si se sincronizó correctamente, False en caso contrario
+        """
+        self.logger.info("Sincronizando documentación con frontend...")
+        
+        sync_script = self._prepare_sync_script()
+        if sync_script is None:
+            return False
+        
+        returncode, stdout, stderr = await run_command_async(
+            [str(sync_script)],
+            cwd=self.docs_dir,
+            check=False,
+            capture_tmpfile=True
+        )
+        return self._handle_sync_result(returncode, stdout, stderr)
+    
     def run(self, validate_only: bool = False, update_postman: bool = True,
             update_docs: bool = True, sync_frontend: bool = True) -> bool:
         """
         Ejecuta el proceso de actualización de documentación.
         
+        Args:
+            validate_only: Solo validar, no actualizar
+            update_postman: Actualizar collection de Postman
+            update_docs: Validar documentación de servicios
+            sync_frontend: Sincronizar frontend de docs
+            
+        Returns:
+            True si todo se ejecutó correctamente, False en caso contrario
+        """
+        try:
+            return asyncio.run(self.run_async(
+                validate_only=validate_only,
+                update_postman=update_postman,
+                update_docs=update_docs,
+                sync_frontend=sync_frontend
+            ))
+        finally:
+            # El log se escribe en bloque: volcarlo antes de devolver el control
+            flush_logging()
+    
+    async def run_async(self, validate_only: bool = False, update_postman: bool = True,
+                        update_docs: bool = True, sync_frontend: bool = True) -> bool:
+        """
+        Versión asíncrona de run.
+        
+        La actualización de la collection de Postman y la validación de
+        documentación son independientes y se ejecutan en paralelo.
+        
         Args:
             validate_only: Solo validar, no actualizar
             update_postman: Actualizar collection de Postman
@@ -274,24 +616,37 @@ class UpdateDocumentationAgent:
         self.logger.info("=" * 60)
         
         success = True
-        
-        # 1. Actualizar collection de Postman
+        # Recorrer services/ de nuevo en cada ejecución; se hace antes de
+        # lanzar los pasos en paralelo para que ambos compartan el recorrido
+        self._services_scan = None
         if update_postman and not validate_only:
-            if not self.update_postman_collection():
-                success = False
+            self._scan_services()
+        
+        loop = asyncio.get_running_loop()
         
-        # 2. Validar documentación de servicios
-        if update_docs:
-            results = self.validate_all_documentation()
-            issues_count = sum(len(r["issues"]) for r in results)
-            if issues_count > 0:
-                self.logger.warning(f"Se encontraron {issues_count} problemas en la documentación")
-                if validate_only:
-                    success = False
+        async def update_postman_step() -> bool:
+            # 1. Actualizar collection de Postman
+            if update_postman and not validate_only:
+                return await loop.run_in_executor(None, self.update_postman_collection)
+            return True
+        
+        async def validate_docs_step() -> bool:
+            # 2. Validar documentación de servicios
+            if update_docs:
+                _, issues_count = await loop.run_in_executor(None, self.validate_all_documentation)
+                if issues_count > 0:
+                    self.logger.warning(f"Se encontraron {issues_count} problemas en la documentación")
+                    if validate_only:
+                        return False
+            return True
+        
+        postman_ok, docs_ok = await asyncio.gather(update_postman_step(), validate_docs_step())
+        if not postman_ok or not docs_ok:
+            success = False
         
         # 3. Sincronizar frontend de docs
         if sync_frontend and not validate_only:
-            if not self.sync_docs_frontend():
+            if not await self.sync_docs_frontend_async():
                 success = False
         
         self.logger.info("=" * 60)
@@ -313,40 +668,22 @@ def main():
     )
     parser.add_argument(
         "--update-postman",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
         default=True,
         help="Actualizar collection de Postman (por defecto: True)"
     )
-    parser.add_argument(
-        "--no-update-postman",
-        dest="update_postman",
-        action="store_false",
-        help="No actualizar collection de Postman"
-    )
     parser.add_argument(
         "--update-docs",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
         default=True,
         help="Validar documentación de servicios (por defecto: True)"
     )
-    parser.add_argument(
-        "--no-update-docs",
-        dest="update_docs",
-        action="store_false",
-        help="No validar documentación de servicios"
-    )
     parser.add_argument(
         "--sync-frontend",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
         default=True,
         help="Sincronizar frontend de docs (por defecto: True)"
     )
-    parser.add_argument(
-        "--no-sync-frontend",
-        dest="sync_frontend",
-        action="store_false",
-        help="No sincronizar frontend de docs"
-    )
     
     args = parser.parse_args()
     
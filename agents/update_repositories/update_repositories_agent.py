@@ -1,34 +1,129 @@
 #!/usr/bin/env python3
 """Agente para actualizar repositorios Git."""
 
+from __future__ import annotations
+
 import argparse
+import importlib.util
+import os
+import re
+import stat
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple, Union
+
+
+class _LazyGit:
+    """
+    Acceso diferido a gitpython: el módulo se importa en el primer acceso a
+    un atributo.
+    
+    gitpython tarda en inicializarse (busca el ejecutable git, carga
+    gitdb...), así que no se paga en rutas que solo usan gh. Si el import
+    falla (p. ej. "Bad git executable") el proceso termina con el error:
+    SystemExit no lo capturan los `except Exception` que rodean las
+    operaciones de Git, y el fallo no queda oculto en un log de depuración.
+    """
+    
+    def __init__(self):
+        self._module = None
+    
+    def __getattr__(self, name: str) -> Any:
+        if self._module is None:
+            try:
+                import git as module
+            except ImportError as e:
+                print(f"Error: no se pudo cargar gitpython: {e}")
+                sys.exit(1)
+            self._module = module
+        return getattr(self._module, name)
+
 
-try:
-    from git import Repo, GitCommandError
-    from git.exc import InvalidGitRepositoryError
-except ImportError:
+if importlib.util.find_spec("git") is None:
     print("Error: gitpython no está instalado. Ejecuta: pip install gitpython")
     sys.exit(1)
 
+git = _LazyGit()
+
 # Agregar el directorio shared al path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from shared.config_loader import ConfigLoader
+from shared.config_loader import get_config, get_project_root
 from shared.github_client import GitHubClient
-from shared.utils import setup_logging
+from shared.utils import flush_logging, run_command, setup_logging
+
+
+_LOG = setup_logging()
+
+# Segundos durante los que se reutiliza el último fetch de un repositorio
+FETCH_TTL_SECONDS = 30
+
+# Repositorios actualizados en paralelo por defecto (pull/push limitados por red)
+DEFAULT_JOBS = 8
+
+# org/nombre al final de URLs HTTPS (https://github.com/org/repo.git)
+# y SSH (git@github.com:org/repo.git)
+_GH_URL_RE = re.compile(r'[:/](?P<org>[^/:]+)/(?P<name>[^/]+?)(?:\.git)?/?$')
+
+
+def _is_git_dir(path: Union[str, Path]) -> bool:
+    """
+    Verifica si una ruta es un repositorio Git con un único stat.
+    
+    Si la ruta no existe, el stat de .git falla igual, por lo que no hace
+    falta comprobar antes el directorio padre.
+    
+    Args:
+        path: Ruta a verificar
+        
+    Returns:
+        True si contiene .git (directorio, o archivo en worktrees/submódulos)
+    """
+    try:
+        mode = os.stat(os.path.join(path, ".git")).st_mode
+    except OSError:
+        return False
+    return stat.S_ISDIR(mode) or stat.S_ISREG(mode)
+
+
+# Rutas ya confirmadas como repositorios Git. Solo se guardan respuestas
+# positivas: un directorio puede pasar a ser repositorio, pero no al revés
+# durante una ejecución
+_INITIALIZED_REPOS: Set[str] = set()
+
+
+def _is_initialized(path: Union[str, Path]) -> bool:
+    """
+    Igual que _is_git_dir, pero recuerda las rutas que ya son repositorios.
+    
+    Args:
+        path: Ruta a verificar
+        
+    Returns:
+        True si contiene .git
+    """
+    key = os.fspath(path)
+    if key in _INITIALIZED_REPOS:
+        return True
+    if _is_git_dir(key):
+        _INITIALIZED_REPOS.add(key)
+        return True
+    return False
 
 
 class UpdateRepositoriesAgent:
     """Agente que actualiza repositorios Git."""
     
+    # Resultado de `gh --version`, compartido por todo el proceso (None = sin comprobar)
+    _GH_AVAILABLE: Optional[bool] = None
+    
     def __init__(self):
         """Inicializa el agente."""
-        self.logger = setup_logging()
-        self.config = ConfigLoader()
-        self.project_root = self.config.get_project_root()
+        self.logger = _LOG
+        self.config = get_config()
+        self.project_root = get_project_root()
         
         # GitHub client es opcional - solo se usa para detectar repos desde la API
         # Las operaciones Git (pull/push) usan la configuración local de Git
@@ -45,6 +140,145 @@ class UpdateRepositoriesAgent:
         except FileNotFoundError:
             self.logger.info("Configuración de GitHub no encontrada - usando detección desde repositorios locales")
             self.github_config = None
+        
+        # Pull del branch actual: sin tags ni otros branches y en fast-forward
+        # (no es un fetch shallow: no usa --depth)
+        self.current_branch_pull = bool(self.github_config.get("current_branch_pull", False)) if self.github_config else False
+        
+        # Cachés por ruta resuelta: objetos Repo y (URL remota, nombre parseado)
+        self._repo_cache: Dict[Path, git.Repo] = {}
+        self._remote_cache: Dict[Path, Tuple[Optional[str], Optional[str], Optional[str]]] = {}
+        # Momento (time.monotonic) del último fetch de cada repositorio
+        self._fetch_times: Dict[Path, float] = {}
+        self.fetch_ttl = FETCH_TTL_SECONDS
+        # Repositorios org/nombre que `gh repo view` confirmó que existen
+        self._gh_cli_existing: Set[str] = set()
+        # mtime_ns de .git/config del repositorio agents cuando se verificó su remoto
+        self._agents_config_mtime: Optional[int] = None
+    
+    def clear_cache(self) -> None:
+        """Descarta todos los datos cacheados de los repositorios."""
+        self._repo_cache.clear()
+        self._remote_cache.clear()
+        self._fetch_times.clear()
+        self._agents_config_mtime = None
+        self.clear_github_cache()
+    
+    def clear_github_cache(self) -> None:
+        """Descarta las respuestas cacheadas de GitHub (API y gh CLI)."""
+        if self.github_client:
+            self.github_client.clear_cache()
+        self._gh_cli_existing.clear()
+    
+    def _get_repo(self, repo_path: Path) -> git.Repo:
+        """
+        Obtiene el objeto Repo de una ruta, reutilizándolo entre llamadas.
+        
+        Args:
+            repo_path: Path al repositorio local
+            
+        Returns:
+            Objeto Repo
+            
+        Raises:
+            InvalidGitRepositoryError: Si la ruta no es un repositorio Git
+        """
+        path = Path(repo_path).resolve()
+        repo = self._repo_cache.get(path)
+        if repo is None:
+            repo = git.Repo(path)
+            self._repo_cache[path] = repo
+        return repo
+    
+    def _invalidate_repo(self, repo_path: Path) -> None:
+        """
+        Descarta los datos cacheados de un repositorio tras modificarlo.
+        
+        Args:
+            repo_path: Path al repositorio local
+        """
+        path = Path(repo_path).resolve()
+        self._repo_cache.pop(path, None)
+        self._remote_cache.pop(path, None)
+    
+    def _read_origin_url(self, repo_path: Path) -> Optional[str]:
+        """
+        Lee la URL del remoto origin directamente de .git/config.
+        
+        Evita crear un Repo (y tocar el índice) cuando solo hace falta la URL.
+        
+        Args:
+            repo_path: Path al repositorio local
+            
+        Returns:
+            URL del remoto origin o None si no está configurado
+        """
+        config_path = os.path.join(repo_path, ".git", "config")
+        if not os.path.isfile(config_path):
+            # .git es un archivo (worktree/submódulo): resolver con GitPython
+            repo = self._get_repo(repo_path)
+            try:
+                origin = repo.remote("origin")
+            except ValueError:
+                return None
+            # .url lee solo la primera URL de la configuración, sin lanzar git
+            return origin.url
+        
+        config = git.GitConfigParser(config_path, read_only=True)
+        try:
+            return config.get_value('remote "origin"', "url", default="") or None
+        finally:
+            config.release()
+    
+    def _get_remote_info(self, repo_path: Path) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Obtiene la URL del remoto origin y la organización y el nombre que contiene.
+        
+        Args:
+            repo_path: Path al repositorio local
+            
+        Returns:
+            Tupla (URL del remoto o None, organización o None, nombre o None);
+            organización y nombre solo se extraen de URLs de GitHub
+        """
+        path = Path(repo_path).resolve()
+        cached = self._remote_cache.get(path)
+        if cached is None:
+            remote_url = self._read_origin_url(path)
+            org = name = None
+            if remote_url and "github.com" in remote_url:
+                match = _GH_URL_RE.search(remote_url)
+                if match:
+                    org, name = match.group("org"), match.group("name")
+            cached = (remote_url, org, name)
+            self._remote_cache[path] = cached
+        return cached
+    
+    def _build_local_index(self) -> Dict[str, Path]:
+        """
+        Indexa por nombre los repositorios Git de los directorios candidatos.
+        
+        Recorre una sola vez, en orden de prioridad, <base>, <base>/services y
+        <base>/mcp para la carpeta padre del proyecto y el propio proyecto; si
+        un nombre aparece varias veces gana la primera ruta encontrada.
+        
+        Returns:
+            Diccionario nombre de directorio -> Path del repositorio
+        """
+        local_index: Dict[str, Path] = {}
+        for base_path in (self.project_root.parent, self.project_root):
+            for subdir in ("", "services", "mcp"):
+                search_dir = base_path / subdir if subdir else base_path
+                try:
+                    with os.scandir(search_dir) as it:
+                        for entry in it:
+                            if entry.name in local_index or not entry.is_dir():
+                                continue
+                            if _is_git_dir(entry.path):
+                                local_index[entry.name] = Path(entry.path)
+                except OSError:
+                    continue
+        return local_index
     
     def get_repositories_list(self) -> List[Dict[str, Any]]:
         """
@@ -55,6 +289,8 @@ class UpdateRepositoriesAgent:
             Lista de diccionarios con información de repositorios
         """
         repos = []
+        # Rutas resueltas ya incluidas: deduplicación O(1), también con symlinks
+        seen: Set[Path] = set()
         
         # 1. Prioridad: Usar configuración de archivo si existe
         if self.github_config:
@@ -62,60 +298,56 @@ class UpdateRepositoriesAgent:
             repo_names = self.github_config.get("repositories", [])
             local_paths = self.github_config.get("local_paths", {})
             
+            local_index = None
             for repo_name in repo_names:
                 local_path = local_paths.get(repo_name)
                 if not local_path:
                     # Intentar detectar automáticamente en subdirectorios comunes
-                    for base_path in [self.project_root.parent, self.project_root]:
-                        potential_paths = [
-                            base_path / repo_name,
-                            base_path / "services" / repo_name,
-                            base_path / "mcp" / repo_name,
-                        ]
-                        for potential_path in potential_paths:
-                            if potential_path.exists() and (potential_path / ".git").exists():
-                                local_path = potential_path
-                                break
-                        if local_path:
-                            break
+                    if local_index is None:
+                        local_index = self._build_local_index()
+                    local_path = local_index.get(repo_name)
                 
                 if local_path:
+                    local_path = Path(local_path)
+                    resolved = local_path.resolve()
+                    if resolved in seen:
+                        continue
+                    seen.add(resolved)
                     repos.append({
                         "name": repo_name,
                         "org": org_name,
-                        "local_path": Path(local_path) if isinstance(local_path, str) else local_path
+                        "local_path": local_path
                     })
         
         # 2. Si no hay config o está vacía, detectar repositorios Git locales
         if not repos:
             self.logger.info("Detectando repositorios Git locales...")
             repos = self._detect_local_git_repos()
+            seen.update(r["local_path"].resolve() for r in repos)
         
         # 3. Agregar el repositorio agents/project-management-agents si existe
         agents_repo_path = self.project_root / "agents" / "project-management-agents"
-        if (agents_repo_path / ".git").exists():
+        if _is_git_dir(agents_repo_path):
             # Verificar que no esté ya en la lista
-            if not any(r["local_path"] == agents_repo_path for r in repos):
+            if agents_repo_path.resolve() not in seen:
                 try:
-                    repo = Repo(agents_repo_path)
                     repo_name = "project-management-agents"
+                    org_name = "trinityweb"
                     
-                    # Intentar obtener nombre del remoto si existe
-                    if repo.remotes:
-                        try:
-                            remote_url = repo.remotes.origin.url
-                            if "github.com" in remote_url:
-                                parts = remote_url.replace(".git", "").split("/")
-                                if len(parts) >= 2:
-                                    repo_name = parts[-1]
-                        except Exception:
-                            pass
+                    # Intentar obtener organización y nombre del remoto si existe
+                    try:
+                        _, remote_org, remote_name = self._get_remote_info(agents_repo_path)
+                        repo_name = remote_name or repo_name
+                        org_name = remote_org or org_name
+                    except Exception:
+                        pass
                     
                     repos.append({
                         "name": repo_name,
-                        "org": "trinityweb",
+                        "org": org_name,
                         "local_path": agents_repo_path
                     })
+                    seen.add(agents_repo_path.resolve())
                     self.logger.info(f"Repositorio agents agregado: {repo_name}")
                 except Exception as e:
                     self.logger.debug(f"No se pudo agregar repositorio agents: {e}")
@@ -125,23 +357,16 @@ class UpdateRepositoriesAgent:
             try:
                 org_name = "trinityweb"
                 github_repos = self.github_client.get_organization_repos(org_name)
+                local_index = self._build_local_index()
                 for repo_info in github_repos:
                     # Buscar el repositorio local
-                    local_path = None
-                    for base_path in [self.project_root.parent, self.project_root]:
-                        potential_paths = [
-                            base_path / repo_info["name"],
-                            base_path / "services" / repo_info["name"],
-                            base_path / "mcp" / repo_info["name"],
-                        ]
-                        for potential_path in potential_paths:
-                            if potential_path.exists() and (potential_path / ".git").exists():
-                                local_path = potential_path
-                                break
-                        if local_path:
-                            break
+                    local_path = local_index.get(repo_info["name"])
                     
                     if local_path:
+                        resolved = local_path.resolve()
+                        if resolved in seen:
+                            continue
+                        seen.add(resolved)
                         repos.append({
                             "name": repo_info["name"],
                             "org": org_name,
@@ -161,6 +386,7 @@ class UpdateRepositoriesAgent:
             Lista de diccionarios con información de repositorios detectados
         """
         repos = []
+        seen: Set[Path] = set()
         
         # Buscar SOLO en directorios específicos dentro del proyecto
         search_dirs = [
@@ -170,65 +396,158 @@ class UpdateRepositoriesAgent:
         ]
         
         for search_dir in search_dirs:
-            if not search_dir.exists():
+            # Abrir directamente en lugar de comprobar antes exists(): un
+            # stat menos por directorio de búsqueda
+            try:
+                it = os.scandir(search_dir)
+            except (FileNotFoundError, NotADirectoryError):
                 self.logger.debug(f"Directorio no existe: {search_dir}")
                 continue
             
             self.logger.debug(f"Buscando repositorios en: {search_dir}")
             
-            # Buscar directorios con .git
-            for item in search_dir.iterdir():
-                if not item.is_dir() or item.name.startswith('.'):
-                    continue
-                
-                git_dir = item / ".git"
-                if git_dir.exists():
-                    # Intentar obtener información del remoto
+            # Buscar directorios con .git; DirEntry.is_dir usa el tipo que
+            # devuelve readdir y solo hace stat para los enlaces simbólicos,
+            # que se siguen para incluir checkouts enlazados (los duplicados
+            # se descartan por su ruta resuelta)
+            with it:
+                for entry in it:
+                    if entry.name.startswith('.') or not entry.is_dir():
+                        continue
+                    
+                    if not _is_git_dir(entry.path):
+                        continue
+                    
+                    # Intentar obtener información del remoto (solo lee
+                    # .git/config, sin abrir el repositorio)
                     try:
-                        repo = Repo(item)
-                        if repo.remotes:
-                            remote_url = repo.remotes.origin.url
+                        remote_url, remote_org, remote_name = self._get_remote_info(entry.path)
+                        if remote_url:
                             # Extraer nombre del repo desde la URL
-                            repo_name = item.name
-                            if "github.com" in remote_url:
-                                # Intentar extraer org/repo de la URL
-                                parts = remote_url.replace(".git", "").split("/")
-                                if len(parts) >= 2:
-                                    repo_name = parts[-1]
+                            repo_name = remote_name or entry.name
                             
+                            item = Path(entry.path)
+                            resolved = item.resolve()
+                            if resolved in seen:
+                                continue
+                            seen.add(resolved)
                             repos.append({
                                 "name": repo_name,
-                                "org": "trinityweb",  # Asumimos por defecto
+                                "org": remote_org or "trinityweb",  # Por defecto trinityweb
                                 "local_path": item
                             })
                             self.logger.info(f"Repositorio detectado: {repo_name} en {item}")
                     except Exception as e:
-                        self.logger.debug(f"No se pudo leer info de {item}: {e}")
+                        self.logger.debug(f"No se pudo leer info de {entry.path}: {e}")
         
         return repos
     
-    def get_repo_status(self, repo_path: Path) -> Dict[str, Any]:
+    def _fetch_if_stale(self, repo: git.Repo, repo_path: Path, force_fetch: bool = False) -> None:
         """
-        Obtiene el estado de un repositorio Git.
+        Hace fetch de origin salvo que ya se hiciera hace menos de fetch_ttl segundos.
         
         Args:
+            repo: Objeto Repo del repositorio
             repo_path: Path al repositorio local
+            force_fetch: Si es True, hace fetch aunque haya uno reciente
+        """
+        try:
+            if not repo.remotes:
+                return
+            remote = repo.remotes.origin
+        except Exception as e:
+            self.logger.debug(f"{repo_path.name}: Error al obtener información de remotes: {e}")
+            return
+        
+        fetch_key = Path(repo_path).resolve()
+        now = time.monotonic()
+        last_fetch = self._fetch_times.get(fetch_key)
+        if force_fetch or last_fetch is None or now - last_fetch > self.fetch_ttl:
+            try:
+                remote.fetch()
+                self._fetch_times[fetch_key] = now
+            except Exception as e:
+                self.logger.debug(f"{repo_path.name}: Error al hacer fetch: {e}")
+    
+    def _count_ahead_behind(self, repo: git.Repo, branch_name: str) -> Tuple[int, int]:
+        """
+        Cuenta los commits por delante/detrás de origin/<branch> con un solo rev-list.
+        
+        Args:
+            repo: Objeto Repo del repositorio
+            branch_name: Nombre del branch local
             
         Returns:
-            Diccionario con el estado del repositorio
+            Tupla (ahead, behind); (0, 0) si no se puede calcular
         """
         try:
-            repo = Repo(repo_path)
-        except InvalidGitRepositoryError:
-            return {
-                "valid": False,
-                "error": "No es un repositorio Git válido"
-            }
+            if not repo.remotes:
+                return 0, 0
+            remote_branch = f"origin/{branch_name}"
+            # Una sola llamada: izquierda = solo en local (ahead),
+            # derecha = solo en remoto (behind)
+            counts = repo.git.rev_list(
+                "--left-right", "--count", f"{branch_name}...{remote_branch}"
+            )
+            ahead_count, behind_count = counts.split()
+            return int(ahead_count), int(behind_count)
         except Exception as e:
-            return {
-                "valid": False,
-                "error": str(e)
-            }
+            self.logger.debug(f"{Path(repo.working_dir).name}: Error al calcular ahead/behind: {e}")
+            return 0, 0
+    
+    def _parse_porcelain_v2(self, repo: git.Repo) -> Dict[str, Any]:
+        """
+        Obtiene branch, cambios, untracked, ahead/behind y conflictos con un
+        único `git status --porcelain=v2 --branch`.
+        
+        Args:
+            repo: Objeto Repo del repositorio
+            
+        Returns:
+            Diccionario parcial de estado; "ahead"/"behind" solo se incluyen
+            si el branch tiene upstream configurado
+            
+        Raises:
+            GitCommandError: Si la versión de Git no soporta el formato v2
+        """
+        output = repo.git.status("--porcelain=v2", "--branch", "--ahead-behind")
+        
+        parsed = {
+            "branch": "unknown",
+            "is_dirty": False,
+            "untracked_files": 0,
+            "has_conflicts": False
+        }
+        for line in output.splitlines():
+            if line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+                if head != "(detached)":
+                    parsed["branch"] = head
+            elif line.startswith("# branch.ab "):
+                ahead, behind = line[len("# branch.ab "):].split()
+                parsed["ahead"] = int(ahead)
+                parsed["behind"] = -int(behind)
+            elif line.startswith("?"):
+                parsed["untracked_files"] += 1
+            elif line.startswith("u "):
+                parsed["has_conflicts"] = True
+                parsed["is_dirty"] = True
+            elif line[:2] in ("1 ", "2 "):
+                parsed["is_dirty"] = True
+        return parsed
+    
+    def _legacy_status(self, repo: git.Repo) -> Dict[str, Any]:
+        """
+        Obtiene el estado con varias llamadas a Git (para versiones antiguas
+        que no soportan `--porcelain=v2`).
+        
+        Args:
+            repo: Objeto Repo del repositorio
+            
+        Returns:
+            Diccionario parcial de estado
+        """
+        name = Path(repo.working_dir).name
         
         # Verificar si el repositorio está sucio de forma segura
         is_dirty = False
@@ -239,68 +558,99 @@ class UpdateRepositoriesAgent:
         except Exception as e:
             # Si hay un error (por ejemplo, alias de Git que no soporta --cached)
             # Intentar método alternativo
-            self.logger.debug(f"Error al verificar estado con is_dirty: {e}")
+            self.logger.debug(f"{name}: Error al verificar estado con is_dirty: {e}")
             try:
                 # Usar git status directamente
                 status_output = repo.git.status("--porcelain")
                 is_dirty = len(status_output.strip()) > 0
                 untracked_count = len([line for line in status_output.split('\n') if line.startswith('??')])
             except Exception as e2:
-                self.logger.warning(f"No se pudo determinar estado del repositorio: {e2}")
+                self.logger.warning(f"{name}: No se pudo determinar estado del repositorio: {e2}")
         
         try:
             branch_name = repo.active_branch.name
         except Exception as e:
-            self.logger.warning(f"No se pudo obtener branch activo: {e}")
+            self.logger.warning(f"{name}: No se pudo obtener branch activo: {e}")
             branch_name = "unknown"
         
-        status = {
-            "valid": True,
-            "path": str(repo_path),
+        has_conflicts = False
+        # Las entradas en conflicto quedan en el índice con stages 1/2/3
+        try:
+            has_conflicts = bool(repo.git.ls_files("--unmerged"))
+        except git.GitCommandError as e:
+            self.logger.debug(f"Error al verificar conflictos: {e}")
+        
+        return {
             "branch": branch_name,
             "is_dirty": is_dirty,
             "untracked_files": untracked_count,
-            "ahead": 0,
-            "behind": 0,
-            "has_conflicts": False
+            "has_conflicts": has_conflicts
         }
+    
+    def get_repo_status(self, repo_path: Path, force_fetch: bool = False,
+                        repo: Optional[git.Repo] = None,
+                        already_fetched: bool = False) -> Dict[str, Any]:
+        """
+        Obtiene el estado de un repositorio Git.
         
-        try:
-            # Obtener información de commits ahead/behind
-            if repo.remotes:
-                remote = repo.remotes.origin
-                try:
-                    remote.fetch()
-                except Exception as e:
-                    self.logger.debug(f"Error al hacer fetch: {e}")
-                
-                try:
-                    # Verificar si el branch remoto existe
-                    remote_branch = f"origin/{status['branch']}"
-                    # Commits locales que no están en remoto (ahead)
-                    commits_ahead = list(repo.iter_commits(f"{remote_branch}..{status['branch']}"))
-                    # Commits remotos que no están en local (behind)
-                    commits_behind = list(repo.iter_commits(f"{status['branch']}..{remote_branch}"))
-                    status["ahead"] = len(commits_ahead)
-                    status["behind"] = len(commits_behind)
-                except Exception as e:
-                    self.logger.debug(f"Error al calcular ahead/behind: {e}")
-        except Exception as e:
-            self.logger.debug(f"Error al obtener información de remotes: {e}")
+        El fetch al remoto se omite si ya se hizo hace menos de fetch_ttl segundos.
         
-        # Verificar conflictos de forma segura
-        if is_dirty:
+        Args:
+            repo_path: Path al repositorio local
+            force_fetch: Si es True, hace fetch aunque haya uno reciente
+            repo: Objeto Repo ya abierto (opcional, evita volver a obtenerlo)
+            already_fetched: Si es True, no hace fetch (quien llama ya lo hizo
+                en esta misma actualización)
+            
+        Returns:
+            Diccionario con el estado del repositorio
+        """
+        if repo is None:
             try:
-                for item in repo.index.diff(None):
-                    if '<<<<<<<' in str(item) or '>>>>>>>' in str(item):
-                        status["has_conflicts"] = True
-                        break
+                repo = self._get_repo(repo_path)
+            except git.exc.InvalidGitRepositoryError:
+                return {
+                    "valid": False,
+                    "error": "No es un repositorio Git válido"
+                }
             except Exception as e:
-                self.logger.debug(f"Error al verificar conflictos: {e}")
+                return {
+                    "valid": False,
+                    "error": str(e)
+                }
+        
+        # El fetch va primero para que ahead/behind reflejen el remoto
+        if not already_fetched:
+            self._fetch_if_stale(repo, repo_path, force_fetch)
+        
+        try:
+            parsed = self._parse_porcelain_v2(repo)
+        except Exception as e:
+            self.logger.debug(f"{Path(repo_path).name}: git status --porcelain=v2 no disponible: {e}")
+            parsed = self._legacy_status(repo)
+        
+        status = {
+            "valid": True,
+            "path": str(repo_path),
+            "branch": parsed["branch"],
+            "is_dirty": parsed["is_dirty"],
+            "untracked_files": parsed["untracked_files"],
+            "ahead": 0,
+            "behind": 0,
+            "has_conflicts": parsed["has_conflicts"]
+        }
+        
+        if "ahead" in parsed:
+            status["ahead"] = parsed["ahead"]
+            status["behind"] = parsed["behind"]
+        elif status["branch"] != "unknown":
+            # Sin upstream configurado: comparar contra origin/<branch>
+            status["ahead"], status["behind"] = self._count_ahead_behind(repo, status["branch"])
         
         return status
     
-    def commit_changes(self, repo_path: Path, dry_run: bool = False, message: str = None) -> bool:
+    def commit_changes(self, repo_path: Path, dry_run: bool = False, message: str = None,
+                       repo: Optional[git.Repo] = None) -> bool:
         """
         Hace commit de cambios locales en un repositorio.
         
@@ -308,64 +658,51 @@ class UpdateRepositoriesAgent:
             repo_path: Path al repositorio local
             dry_run: Si es True, solo simula la operación
             message: Mensaje de commit (si es None, usa mensaje por defecto)
+            repo: Objeto Repo ya abierto (opcional, evita volver a obtenerlo)
             
         Returns:
             True si se hizo commit correctamente, False en caso contrario
         """
-        try:
-            repo = Repo(repo_path)
-        except InvalidGitRepositoryError:
-            self.logger.error(f"{repo_path.name}: No es un repositorio Git válido")
-            return False
+        # En simulación no hace falta abrir el repositorio ni detectar cambios:
+        # quien llama ya sabe que hay cambios pendientes
+        if dry_run:
+            self.logger.info(f"{repo_path.name}: [DRY RUN] Hacer commit de cambios locales")
+            return True
         
-        # Verificar si hay cambios para commitear
+        if repo is None:
+            try:
+                repo = self._get_repo(repo_path)
+            except git.exc.InvalidGitRepositoryError:
+                self.logger.error(f"{repo_path.name}: No es un repositorio Git válido")
+                return False
+        
+        # Verificar si hay cambios para commitear: un único status con
+        # registros terminados en NUL (correcto con nombres con saltos de línea)
         try:
-            # Obtener archivos modificados y sin seguimiento
-            modified_files = [item.a_path for item in repo.index.diff(None)]
-            untracked_files = repo.untracked_files
-            
-            if not modified_files and not untracked_files:
+            status_output = repo.git.status("--porcelain=v1", "-z")
+            if not status_output:
                 self.logger.info(f"{repo_path.name}: No hay cambios para commitear")
                 return True
         except Exception as e:
-            self.logger.debug(f"Error al verificar cambios: {e}")
-            # Intentar método alternativo
-            try:
-                status_output = repo.git.status("--porcelain")
-                if not status_output.strip():
-                    self.logger.info(f"{repo_path.name}: No hay cambios para commitear")
-                    return True
-            except Exception as e2:
-                self.logger.error(f"{repo_path.name}: Error al verificar cambios: {e2}")
-                return False
-        
-        if dry_run:
-            self.logger.info(f"{repo_path.name}: [DRY RUN] Hacer commit de cambios locales")
-            return True
+            self.logger.error(f"{repo_path.name}: Error al verificar cambios: {e}")
+            return False
         
         try:
             # Agregar todos los cambios (Git respetará automáticamente .gitignore)
             self.logger.info(f"{repo_path.name}: Agregando cambios al staging...")
             repo.git.add(A=True)
             
-            # Verificar que hay algo para commitear después de agregar
-            # Si es el primer commit, no habrá HEAD
+            # Verificar que hay algo para commitear después de agregar:
+            # --quiet sale con código 1 si hay cambios en staging (también
+            # funciona sin HEAD, en el primer commit)
             try:
-                has_staged = len(repo.index.diff("HEAD")) > 0 if repo.heads else True
-                has_untracked = len(repo.untracked_files) > 0
-                if not has_staged and not has_untracked:
-                    self.logger.info(f"{repo_path.name}: No hay cambios para commitear (todos ignorados por .gitignore)")
-                    return True
-            except Exception:
-                # Si no hay HEAD (primer commit), verificar staged directamente
-                try:
-                    staged_files = repo.git.diff("--cached", "--name-only")
-                    if not staged_files.strip() and not repo.untracked_files:
-                        self.logger.info(f"{repo_path.name}: No hay cambios para commitear")
-                        return True
-                except Exception:
-                    # Si falla, intentar commit de todas formas
-                    pass
+                repo.git.diff("--cached", "--quiet")
+                self.logger.info(f"{repo_path.name}: No hay cambios para commitear (todos ignorados por .gitignore)")
+                return True
+            except git.GitCommandError as e:
+                if e.status != 1:
+                    # Si falla por otro motivo, intentar commit de todas formas
+                    self.logger.debug(f"{repo_path.name}: Error al verificar cambios en staging: {e}")
             
             # Crear mensaje de commit
             if not message:
@@ -374,10 +711,11 @@ class UpdateRepositoriesAgent:
             # Hacer commit
             self.logger.info(f"{repo_path.name}: Haciendo commit...")
             repo.index.commit(message)
+            self._invalidate_repo(repo_path)
             self.logger.info(f"{repo_path.name}: Commit completado")
             return True
         
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             self.logger.error(f"{repo_path.name}: Error al hacer commit: {e}")
             return False
         except Exception as e:
@@ -396,9 +734,8 @@ class UpdateRepositoriesAgent:
         Returns:
             True si se inicializó correctamente, False en caso contrario
         """
-        git_dir = repo_path / ".git"
-        if git_dir.exists():
-            self.logger.debug(f"{repo_path.name}: Ya es un repositorio Git")
+        if _is_initialized(repo_path):
+            self.logger.debug("%s: Ya es un repositorio Git", repo_path.name)
             return True
         
         if dry_run:
@@ -407,7 +744,8 @@ class UpdateRepositoriesAgent:
         
         try:
             self.logger.info(f"{repo_path.name}: Inicializando repositorio Git...")
-            repo = Repo.init(repo_path)
+            repo = git.Repo.init(repo_path)
+            _INITIALIZED_REPOS.add(os.fspath(repo_path))
             
             # Configurar remoto si se proporciona
             if remote_url:
@@ -449,21 +787,29 @@ class UpdateRepositoriesAgent:
                 "clone_url": f"https://github.com/{org_name}/{repo_name}.git"
             }
         
+        full_name = f"{org_name}/{repo_name}"
         try:
-            # Verificar si gh está instalado
-            from shared.utils import run_command
-            returncode, _, _ = run_command(["gh", "--version"], check=False, capture_output=True)
-            if returncode != 0:
+            # Verificar si gh está instalado (una sola vez por proceso)
+            if UpdateRepositoriesAgent._GH_AVAILABLE is None:
+                try:
+                    returncode, _, _ = run_command(["gh", "--version"], check=False, capture_output=True)
+                    UpdateRepositoriesAgent._GH_AVAILABLE = returncode == 0
+                except OSError:
+                    UpdateRepositoriesAgent._GH_AVAILABLE = False
+            if not UpdateRepositoriesAgent._GH_AVAILABLE:
                 self.logger.debug("GitHub CLI (gh) no está instalado")
                 return None
             
             # Verificar si el repositorio ya existe
-            returncode, stdout, stderr = run_command(
-                ["gh", "repo", "view", f"{org_name}/{repo_name}"],
-                check=False,
-                capture_output=True
-            )
-            if returncode == 0:
+            if full_name not in self._gh_cli_existing:
+                returncode, _, _ = run_command(
+                    ["gh", "repo", "view", full_name],
+                    check=False,
+                    capture_output=True
+                )
+                if returncode == 0:
+                    self._gh_cli_existing.add(full_name)
+            if full_name in self._gh_cli_existing:
                 # El repositorio ya existe
                 self.logger.info(f"Repositorio {repo_name} ya existe en GitHub")
                 return {
@@ -500,6 +846,7 @@ class UpdateRepositoriesAgent:
                 capture_output=True
             )
             if returncode == 0:
+                self._gh_cli_existing.add(full_name)
                 self.logger.info(f"✅ Repositorio {repo_name} creado en GitHub y contenido subido")
                 return {
                     "name": repo_name,
@@ -524,6 +871,7 @@ class UpdateRepositoriesAgent:
                     capture_output=True
                 )
                 if returncode2 == 0:
+                    self._gh_cli_existing.add(full_name)
                     self.logger.info(f"✅ Repositorio {repo_name} creado en GitHub (sin push inicial)")
                     return {
                         "name": repo_name,
@@ -622,22 +970,25 @@ class UpdateRepositoriesAgent:
                 self.logger.warning(f"⚠️  Error al crear repositorio en GitHub: {error_msg}")
             return None
     
-    def pull_repository(self, repo_path: Path, dry_run: bool = False) -> bool:
+    def pull_repository(self, repo_path: Path, dry_run: bool = False,
+                        repo: Optional[git.Repo] = None) -> bool:
         """
         Hace pull de un repositorio.
         
         Args:
             repo_path: Path al repositorio local
             dry_run: Si es True, solo simula la operación
+            repo: Objeto Repo ya abierto (opcional, evita volver a obtenerlo)
             
         Returns:
             True si se hizo pull correctamente, False en caso contrario
         """
-        try:
-            repo = Repo(repo_path)
-        except InvalidGitRepositoryError:
-            self.logger.error(f"{repo_path.name}: No es un repositorio Git válido")
-            return False
+        if repo is None:
+            try:
+                repo = self._get_repo(repo_path)
+            except git.exc.InvalidGitRepositoryError:
+                self.logger.error(f"{repo_path.name}: No es un repositorio Git válido")
+                return False
         
         if dry_run:
             self.logger.info(f"{repo_path.name}: [DRY RUN] Hacer pull")
@@ -652,11 +1003,17 @@ class UpdateRepositoriesAgent:
             # Hacer pull
             self.logger.info(f"{repo_path.name}: Haciendo pull...")
             origin = repo.remotes.origin
-            origin.pull()
+            if self.current_branch_pull:
+                self._pull_current_branch(repo, origin)
+            else:
+                origin.pull()
+            self._invalidate_repo(repo_path)
+            # pull incluye un fetch: las referencias remotas están al día
+            self._fetch_times[Path(repo_path).resolve()] = time.monotonic()
             self.logger.info(f"{repo_path.name}: Pull completado")
             return True
         
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             if "conflict" in str(e).lower() or "merge" in str(e).lower():
                 self.logger.error(f"{repo_path.name}: Conflicto de merge detectado")
                 return False
@@ -666,24 +1023,48 @@ class UpdateRepositoriesAgent:
             self.logger.error(f"{repo_path.name}: Error inesperado: {e}")
             return False
     
-    def push_repository(self, repo_path: Path, dry_run: bool = False) -> bool:
+    def _pull_current_branch(self, repo: git.Repo, origin) -> None:
+        """
+        Trae solo el branch actual (sin tags ni otros branches) y avanza en
+        fast-forward; falla si el branch local divergió del remoto.
+        
+        No se pasa --depth: convertiría en shallow un repositorio completo, y
+        en uno ya shallow el fetch solo trae los commits nuevos.
+        
+        Args:
+            repo: Objeto Repo del repositorio
+            origin: Remoto origin del repositorio
+            
+        Raises:
+            GitCommandError: Si el fetch falla o no es posible el fast-forward
+        """
+        branch_name = repo.active_branch.name
+        origin.fetch(branch_name, no_tags=True)
+        repo.git.merge("--ff-only", f"{origin.name}/{branch_name}")
+    
+    def push_repository(self, repo_path: Path, dry_run: bool = False,
+                        repo: Optional[git.Repo] = None,
+                        already_fetched: bool = False) -> bool:
         """
         Hace push de un repositorio.
         
         Args:
             repo_path: Path al repositorio local
             dry_run: Si es True, solo simula la operación
+            repo: Objeto Repo ya abierto (opcional, evita volver a obtenerlo)
+            already_fetched: Si es True, el estado se calcula sin volver a hacer fetch
             
         Returns:
             True si se hizo push correctamente, False en caso contrario
         """
-        try:
-            repo = Repo(repo_path)
-        except InvalidGitRepositoryError:
-            self.logger.error(f"{repo_path.name}: No es un repositorio Git válido")
-            return False
+        if repo is None:
+            try:
+                repo = self._get_repo(repo_path)
+            except git.exc.InvalidGitRepositoryError:
+                self.logger.error(f"{repo_path.name}: No es un repositorio Git válido")
+                return False
         
-        status = self.get_repo_status(repo_path)
+        status = self.get_repo_status(repo_path, repo=repo, already_fetched=already_fetched)
         if status["ahead"] == 0:
             self.logger.info(f"{repo_path.name}: No hay commits para hacer push")
             return True
@@ -696,36 +1077,53 @@ class UpdateRepositoriesAgent:
             self.logger.info(f"{repo_path.name}: Haciendo push ({status['ahead']} commits)...")
             origin = repo.remotes.origin
             origin.push()
+            self._invalidate_repo(repo_path)
             self.logger.info(f"{repo_path.name}: Push completado")
             return True
         
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             self.logger.error(f"{repo_path.name}: Error al hacer push: {e}")
             return False
         except Exception as e:
             self.logger.error(f"{repo_path.name}: Error inesperado: {e}")
             return False
     
-    def handle_conflicts(self, repo_path: Path) -> bool:
+    def handle_conflicts(self, repo_path: Path, repo: Optional[git.Repo] = None,
+                         status: Optional[Dict[str, Any]] = None) -> bool:
         """
         Detecta y reporta conflictos en un repositorio.
         
         Args:
             repo_path: Path al repositorio local
+            repo: Objeto Repo ya abierto (opcional, evita volver a obtenerlo)
+            status: Estado ya calculado con get_repo_status (opcional, evita recalcularlo)
             
         Returns:
             True si no hay conflictos, False si hay conflictos que requieren resolución manual
         """
-        status = self.get_repo_status(repo_path)
+        if status is None:
+            status = self.get_repo_status(repo_path, repo=repo)
         
         if status.get("has_conflicts"):
             self.logger.error(f"{repo_path.name}: CONFLICTOS DETECTADOS - Requiere resolución manual")
-            self.logger.error(f"  Path: {status['path']}")
-            self.logger.error(f"  Branch: {status['branch']}")
+            self.logger.error(f"{repo_path.name}:   Path: {status['path']}")
+            self.logger.error(f"{repo_path.name}:   Branch: {status['branch']}")
             return False
         
         return True
     
+    def _has_local_changes(self, status: Dict[str, Any]) -> bool:
+        """
+        Indica si el estado tiene cambios sin commit o archivos sin seguimiento.
+        
+        Args:
+            status: Estado devuelto por get_repo_status
+            
+        Returns:
+            True si hay cambios locales
+        """
+        return status.get("is_dirty", False) or status.get("untracked_files", 0) > 0
+    
     def update_repository(self, repo_info: Dict[str, Any], auto_commit: bool = False,
                          dry_run: bool = False) -> Dict[str, Any]:
         """
@@ -758,9 +1156,17 @@ class UpdateRepositoriesAgent:
             self.logger.warning(f"{repo_name}: Directorio no existe: {repo_path}")
             return result
         
-        # Verificar estado
+        # Abrir el repositorio una sola vez para todo el flujo; si falla,
+        # get_repo_status informa el error
         try:
-            status = self.get_repo_status(repo_path)
+            repo = self._get_repo(repo_path)
+        except Exception:
+            repo = None
+        
+        # Verificar estado (único fetch de la actualización; las consultas
+        # posteriores reutilizan las referencias remotas ya descargadas)
+        try:
+            status = self.get_repo_status(repo_path, repo=repo)
         except Exception as e:
             result["errors"].append(f"Error al obtener estado: {e}")
             self.logger.error(f"{repo_name}: Error al obtener estado: {e}")
@@ -771,41 +1177,32 @@ class UpdateRepositoriesAgent:
             return result
         
         # Verificar conflictos
-        if not self.handle_conflicts(repo_path):
+        if not self.handle_conflicts(repo_path, repo=repo, status=status):
             result["has_conflicts"] = True
             result["errors"].append("Conflictos detectados - requiere resolución manual")
             return result
         
         # Hacer commit de cambios locales si está habilitado
         if auto_commit:
-            # Verificar cambios de forma más robusta
-            try:
-                repo = Repo(repo_path)
-                status_output = repo.git.status("--porcelain")
-                has_changes = len(status_output.strip()) > 0
-            except Exception as e:
-                self.logger.debug(f"Error al verificar cambios: {e}")
-                has_changes = status.get("is_dirty", False) or status.get("untracked_files", 0) > 0
-            
-            if has_changes:
+            # El estado ya incluye cambios en staging, sin staging y sin seguimiento
+            if self._has_local_changes(status):
                 self.logger.info(f"{repo_name}: Haciendo commit automático de cambios locales...")
-                if self.commit_changes(repo_path, dry_run=dry_run):
+                if self.commit_changes(repo_path, dry_run=dry_run, repo=repo):
                     result["committed"] = True
                     # Actualizar estado después del commit
-                    status = self.get_repo_status(repo_path)
+                    status = self.get_repo_status(repo_path, repo=repo, already_fetched=True)
                 else:
                     result["errors"].append("Error al hacer commit automático")
                     # Continuar aunque falle el commit
             else:
-                self.logger.debug(f"{repo_name}: No hay cambios para commitear")
+                self.logger.debug("%s: No hay cambios para commitear", repo_name)
         
         # Hacer pull si hay cambios remotos
         behind = status.get("behind", 0)
         if behind > 0:
-            self.logger.info(f"{repo_name}: {behind} commits detrás del remoto - haciendo pull...")
-            if self.pull_repository(repo_path, dry_run=dry_run):
+            self.logger.debug("%s: %d commits detrás del remoto", repo_name, behind)
+            if self.pull_repository(repo_path, dry_run=dry_run, repo=repo):
                 result["pulled"] = True
-                self.logger.info(f"{repo_name}: Pull completado")
             else:
                 result["errors"].append("Error al hacer pull")
                 # Continuar aunque falle el pull
@@ -815,10 +1212,9 @@ class UpdateRepositoriesAgent:
         # Hacer push si hay commits locales
         ahead = status.get("ahead", 0)
         if ahead > 0:
-            self.logger.info(f"{repo_name}: {ahead} commits por delante del remoto - haciendo push...")
-            if self.push_repository(repo_path, dry_run=dry_run):
+            self.logger.debug("%s: %d commits por delante del remoto", repo_name, ahead)
+            if self.push_repository(repo_path, dry_run=dry_run, repo=repo, already_fetched=True):
                 result["pushed"] = True
-                self.logger.info(f"{repo_name}: Push completado")
             else:
                 result["errors"].append("Error al hacer push")
                 # Continuar aunque falle el push
@@ -836,10 +1232,113 @@ class UpdateRepositoriesAgent:
         
         return result
     
+    def _map_repos(self, fn: Callable[..., Any], repos: List[Dict[str, Any]],
+                   jobs: int = DEFAULT_JOBS, **kwargs) -> List[Any]:
+        """
+        Aplica una operación a cada repositorio en paralelo.
+        
+        Los objetos Repo salen de la caché compartida _repo_cache, pero cada
+        repositorio lo procesa un único hilo, así que ningún Repo se usa desde
+        dos hilos a la vez. Los mensajes de distintos repositorios se intercalan:
+        cada uno empieza con el nombre del repositorio.
+        
+        Con más de un hilo, Git no puede pedir credenciales por terminal (varios
+        prompts competirían por la misma consola): se fija GIT_TERMINAL_PROMPT=0
+        y las operaciones que las necesiten fallan en lugar de bloquearse.
+        
+        Args:
+            fn: Función a aplicar, recibe la información del repositorio
+            repos: Lista de repositorios
+            jobs: Número máximo de repositorios procesados a la vez
+            **kwargs: Argumentos adicionales para fn
+            
+        Returns:
+            Lista de resultados en el mismo orden que repos
+        """
+        if not repos:
+            return []
+        
+        workers = max(1, min(jobs, len(repos)))
+        if workers == 1:
+            return [fn(repo_info, **kwargs) for repo_info in repos]
+        
+        # GitPython y run_command heredan os.environ en cada subproceso
+        previous_prompt = os.environ.get("GIT_TERMINAL_PROMPT")
+        os.environ["GIT_TERMINAL_PROMPT"] = "0"
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(fn, repo_info, **kwargs) for repo_info in repos]
+                return [future.result() for future in futures]
+        finally:
+            if previous_prompt is None:
+                os.environ.pop("GIT_TERMINAL_PROMPT", None)
+            else:
+                os.environ["GIT_TERMINAL_PROMPT"] = previous_prompt
+    
+    def _process_repository(self, repo_info: Dict[str, Any], auto_commit: bool = False,
+                            dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Actualiza un repositorio capturando cualquier error inesperado.
+        
+        Args:
+            repo_info: Información del repositorio
+            auto_commit: Si es True, hace commit automático de cambios locales
+            dry_run: Si es True, solo simula las operaciones
+            
+        Returns:
+            Diccionario con el resultado de la actualización
+        """
+        self.logger.info(f"{repo_info['name']}: Procesando...")
+        try:
+            result = self.update_repository(repo_info, auto_commit=auto_commit, dry_run=dry_run)
+        except Exception as e:
+            self.logger.error(f"❌ {repo_info['name']}: Error inesperado: {e}")
+            return {
+                "name": repo_info['name'],
+                "success": False,
+                "has_conflicts": False,
+                "errors": [str(e)]
+            }
+        
+        if result["success"]:
+            actions = []
+            if result.get("committed"):
+                actions.append("commit")
+            if result.get("pulled"):
+                actions.append("pull")
+            if result.get("pushed"):
+                actions.append("push")
+            action_str = f" ({', '.join(actions)})" if actions else ""
+            self.logger.info(f"✅ {result['name']}: Actualizado correctamente{action_str}")
+        else:
+            error_msg = '; '.join(result['errors']) if result['errors'] else "Sin cambios"
+            self.logger.warning(f"⚠️  {result['name']}: {error_msg}")
+        
+        return result
+    
+    def _config_mtime(self, repo_path: Path) -> Optional[int]:
+        """
+        Obtiene el mtime_ns de .git/config de un repositorio.
+        
+        Args:
+            repo_path: Ruta al repositorio
+            
+        Returns:
+            mtime_ns del archivo, o None si no existe (p. ej. worktrees)
+        """
+        try:
+            return os.stat(os.path.join(repo_path, ".git", "config")).st_mtime_ns
+        except OSError:
+            return None
+    
     def ensure_agents_repo_exists(self, dry_run: bool = False) -> bool:
         """
         Asegura que el repositorio agents/project-management-agents existe en GitHub.
         
+        Una vez verificado, las llamadas siguientes (p. ej. ejecuciones repetidas
+        de run()) no vuelven a comprobarlo mientras no cambie .git/config del
+        repositorio o se llame a clear_cache().
+        
         Args:
             dry_run: Si es True, solo simula la operación
             
@@ -849,27 +1348,31 @@ class UpdateRepositoriesAgent:
         agents_dir = self.project_root / "agents" / "project-management-agents"
         repo_name = "project-management-agents"
         
+        if self._agents_config_mtime is not None:
+            if self._config_mtime(agents_dir) == self._agents_config_mtime:
+                return True
+            # La configuración cambió desde la última verificación
+            self._agents_config_mtime = None
+            self._invalidate_repo(agents_dir)
+        
         # Verificar si es un repositorio Git
-        if not (agents_dir / ".git").exists():
+        if not _is_initialized(agents_dir):
             self.logger.info(f"Inicializando repositorio Git en {agents_dir}...")
             if not self.initialize_repo(agents_dir, dry_run=dry_run):
                 return False
         
-        # Verificar si el remoto ya está configurado
-        repo = Repo(agents_dir)
+        # Verificar si el remoto ya está configurado (lee solo .git/config,
+        # cacheado junto al resto de remotos)
         remote_configured = False
         org_name = "trinityweb"
         try:
-            if "origin" in [r.name for r in repo.remotes]:
-                origin = repo.remote("origin")
-                remote_urls = list(origin.urls) if origin.urls else []
-                if remote_urls:
-                    remote_url = remote_urls[0]
-                    # Verificar si el remoto apunta al repositorio correcto
-                    if remote_url and (f"{org_name}/{repo_name}" in remote_url or repo_name in remote_url):
-                        self.logger.info(f"Remoto 'origin' ya está configurado: {remote_url}")
-                        remote_configured = True
-                        return True  # Ya está todo configurado, no necesitamos crear nada
+            remote_url = self._get_remote_info(agents_dir)[0]
+            # Verificar si el remoto apunta al repositorio correcto
+            if remote_url and (f"{org_name}/{repo_name}" in remote_url or repo_name in remote_url):
+                self.logger.info(f"Remoto 'origin' ya está configurado: {remote_url}")
+                remote_configured = True
+                self._agents_config_mtime = self._config_mtime(agents_dir)
+                return True  # Ya está todo configurado, no necesitamos crear nada
         except Exception as e:
             self.logger.debug(f"Error al verificar remoto: {e}")
         
@@ -886,12 +1389,15 @@ class UpdateRepositoriesAgent:
             if repo_info and not dry_run:
                 # Configurar remoto si no existe
                 try:
+                    repo = self._get_repo(agents_dir)
                     if not repo.remotes:
                         repo.create_remote('origin', repo_info['clone_url'])
                         self.logger.info(f"✅ Remoto 'origin' configurado: {repo_info['clone_url']}")
                     elif repo.remotes.origin.url != repo_info['clone_url']:
                         self.logger.info(f"Actualizando remoto 'origin' a: {repo_info['clone_url']}")
                         repo.remotes.origin.set_url(repo_info['clone_url'])
+                    self._invalidate_repo(agents_dir)
+                    self._agents_config_mtime = self._config_mtime(agents_dir)
                 except Exception as e:
                     self.logger.warning(f"Error al configurar remoto: {e}")
         elif not repo_info and not dry_run:
@@ -901,7 +1407,8 @@ class UpdateRepositoriesAgent:
         return True
     
     def run(self, repo_name: Optional[str] = None, auto_commit: bool = False,
-            dry_run: bool = False, ensure_agents_repo: bool = True) -> bool:
+            dry_run: bool = False, ensure_agents_repo: bool = True,
+            use_cache: bool = True, jobs: int = DEFAULT_JOBS) -> bool:
         """
         Ejecuta el proceso de actualización de repositorios.
         
@@ -910,10 +1417,18 @@ class UpdateRepositoriesAgent:
             auto_commit: Si es True, hace commit automático de cambios locales
             dry_run: Si es True, solo simula las operaciones
             ensure_agents_repo: Si es True, verifica/crea el repositorio agents
+            use_cache: Si es False, descarta la caché y hace fetch en cada consulta de estado
+            jobs: Número máximo de repositorios actualizados en paralelo
             
         Returns:
             True si todo se ejecutó correctamente, False en caso contrario
         """
+        # El TTL se fija en cada ejecución: un run(use_cache=False) anterior no
+        # debe dejar desactivada la reutilización del fetch en las siguientes
+        self.fetch_ttl = FETCH_TTL_SECONDS if use_cache else 0
+        if not use_cache:
+            self.clear_cache()
+        
         self.logger.info("=" * 60)
         self.logger.info("Actualizando repositorios")
         if dry_run:
@@ -932,6 +1447,7 @@ class UpdateRepositoriesAgent:
         
         if not repos:
             self.logger.warning("No se encontraron repositorios para actualizar")
+            flush_logging()
             return False
         
         # Filtrar por nombre si se especificó
@@ -939,35 +1455,13 @@ class UpdateRepositoriesAgent:
             repos = [r for r in repos if r["name"] == repo_name]
             if not repos:
                 self.logger.error(f"Repositorio no encontrado: {repo_name}")
+                flush_logging()
                 return False
         
-        results = []
-        for repo_info in repos:
-            self.logger.info(f"\nProcesando: {repo_info['name']}")
-            try:
-                result = self.update_repository(repo_info, auto_commit=auto_commit, dry_run=dry_run)
-                results.append(result)
-                
-                if result["success"]:
-                    actions = []
-                    if result.get("committed"):
-                        actions.append("commit")
-                    if result.get("pulled"):
-                        actions.append("pull")
-                    if result.get("pushed"):
-                        actions.append("push")
-                    action_str = f" ({', '.join(actions)})" if actions else ""
-                    self.logger.info(f"✅ {result['name']}: Actualizado correctamente{action_str}")
-                else:
-                    error_msg = '; '.join(result['errors']) if result['errors'] else "Sin cambios"
-                    self.logger.warning(f"⚠️  {result['name']}: {error_msg}")
-            except Exception as e:
-                self.logger.error(f"❌ {repo_info['name']}: Error inesperado: {e}")
-                results.append({
-                    "name": repo_info['name'],
-                    "success": False,
-                    "errors": [str(e)]
-                })
+        # Las operaciones Git están dominadas por E/S (red y disco): procesar
+        # los repositorios en paralelo
+        results = self._map_repos(self._process_repository, repos, jobs=jobs,
+                                  auto_commit=auto_commit, dry_run=dry_run)
         
         # Resumen
         self.logger.info("\n" + "=" * 60)
@@ -979,6 +1473,8 @@ class UpdateRepositoriesAgent:
             self.logger.warning(f"  Con conflictos: {conflicts}")
         self.logger.info("=" * 60)
         
+        # El log se escribe en bloque: volcarlo antes de devolver el control
+        flush_logging()
         return successful == len(results)
 
 
@@ -1008,6 +1504,19 @@ def main():
         action="store_true",
         help="Solo simular operaciones, no hacer cambios reales"
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="No reutilizar fetch ni datos de repositorios consultados recientemente"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=(f"Número de repositorios actualizados en paralelo (default: {DEFAULT_JOBS}); "
+              "con más de 1, Git no pide credenciales por terminal")
+    )
     
     args = parser.parse_args()
     
@@ -1016,7 +1525,9 @@ def main():
         repo_name=args.repo,
         auto_commit=args.auto_commit,
         dry_run=args.dry_run,
-        ensure_agents_repo=getattr(args, 'ensure_agents_repo', True)
+        ensure_agents_repo=getattr(args, 'ensure_agents_repo', True),
+        use_cache=args.use_cache,
+        jobs=args.jobs
     )
     
     sys.exit(0 if success else 1)
@@ -2,11 +2,34 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 from dotenv import load_dotenv
 
 
+# Archivos .env ya cargados en este proceso
+_LOADED_ENV_FILES: Set[str] = set()
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Lee y parsea un archivo JSON, cacheado por ruta y fecha de modificación.
+    
+    El diccionario devuelto es compartido entre llamadas: no modificarlo.
+    
+    Args:
+        path: Ruta al archivo
+        mtime_ns: Fecha de modificación (solo forma parte de la clave de caché)
+        
+    Returns:
+        Contenido del archivo
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class ConfigLoader:
     """Carga y gestiona la configuración de los agentes."""
     
@@ -31,8 +54,12 @@ class ConfigLoader:
         if not env_file.exists():
             env_file = self.base_dir / "env.example"
         
-        if env_file.exists():
+        # load_dotenv no sobrescribe variables ya definidas, así que volver a
+        # cargar el mismo archivo en otra instancia no cambiaría nada
+        env_key = str(env_file)
+        if env_key not in _LOADED_ENV_FILES and env_file.exists():
             load_dotenv(env_file)
+            _LOADED_ENV_FILES.add(env_key)
     
     def load_env(self, key: str, default: Optional[str] = None) -> str:
         """
@@ -57,6 +84,8 @@ class ConfigLoader:
         """
         Carga la configuración de GitHub.
         
+        El archivo solo se vuelve a parsear si cambió desde la última lectura.
+        
         Returns:
             Diccionario con la configuración de GitHub
             
@@ -64,17 +93,18 @@ class ConfigLoader:
             FileNotFoundError: Si el archivo de configuración no existe
         """
         config_file = self.config_dir / "github-config.json"
-        if not config_file.exists():
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
             example_file = self.config_dir / "github-config.example.json"
             if example_file.exists():
                 raise FileNotFoundError(
                     f"Archivo de configuración no encontrado: {config_file}\n"
                     f"Copia {example_file} a {config_file} y configura tus valores."
-                )
-            raise FileNotFoundError(f"Archivo de configuración no encontrado: {config_file}")
+                ) from None
+            raise FileNotFoundError(f"Archivo de configuración no encontrado: {config_file}") from None
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_json_cached(str(config_file), mtime_ns)
     
     def get_project_root(self) -> Path:
         """
@@ -124,3 +154,30 @@ class ConfigLoader:
         """
         return self.load_env("GITHUB_TOKEN")
 
+
+@lru_cache(maxsize=1)
+def get_config() -> ConfigLoader:
+    """
+    Obtiene una instancia compartida de ConfigLoader.
+    
+    Evita recargar el .env en cada instanciación de un agente. Usar
+    get_config.cache_clear() si se necesita recargar la configuración.
+    
+    Returns:
+        Instancia de ConfigLoader con el directorio de configuración por defecto
+    """
+    return ConfigLoader()
+
+
+@lru_cache(maxsize=1)
+def get_project_root() -> Path:
+    """
+    Obtiene la ruta raíz del proyecto, resuelta una sola vez por proceso.
+    
+    Returns:
+        Path a la raíz del proyecto
+        
+    Raises:
+        ValueError: Si no se puede determinar PROJECT_ROOT
+    """
+    return get_config().get_project_root()
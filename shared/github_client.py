@@ -1,11 +1,16 @@
 """Cliente para interactuar con la API de GitHub."""
 
 import os
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from github import Github
 from github.GithubException import GithubException
 
 
+# Elementos por página en los listados (máximo de la API REST; por defecto 30)
+PER_PAGE = 100
+
+
 class GitHubClient:
     """Cliente para interactuar con la API de GitHub."""
     
@@ -16,19 +21,43 @@ class GitHubClient:
         Args:
             token: Personal Access Token de GitHub
         """
-        self.github = Github(token)
         self.token = token
+        # Respuestas de la API cacheadas durante la vida del cliente
+        self._org_repos_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._repo_info_cache: Dict[str, Dict[str, Any]] = {}
+    
+    @cached_property
+    def github(self) -> Github:
+        """
+        Cliente de PyGithub, construido en el primer uso.
+        
+        Si la ejecución no llega a hacer ninguna llamada a la API no se paga
+        la inicialización del cliente.
+        """
+        return Github(self.token, per_page=PER_PAGE)
+    
+    def clear_cache(self) -> None:
+        """Descarta las respuestas cacheadas de la API."""
+        self._org_repos_cache.clear()
+        self._repo_info_cache.clear()
     
-    def get_organization_repos(self, org_name: str) -> List[Dict[str, Any]]:
+    def get_organization_repos(self, org_name: str, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Obtiene la lista de repositorios de una organización.
         
+        El resultado se cachea por organización; las llamadas siguientes no
+        vuelven a paginar la API.
+        
         Args:
             org_name: Nombre de la organización
+            refresh: Si es True, ignora la caché y vuelve a consultar la API
             
         Returns:
             Lista de diccionarios con información de los repositorios
         """
+        if not refresh and org_name in self._org_repos_cache:
+            return self._org_repos_cache[org_name]
+        
         try:
             org = self.github.get_organization(org_name)
             repos = []
@@ -42,42 +71,67 @@ class GitHubClient:
                     "private": repo.private,
                     "description": repo.description,
                 })
+            self._org_repos_cache[org_name] = repos
             return repos
         except GithubException as e:
             raise Exception(f"Error al obtener repositorios de {org_name}: {e}")
     
-    def get_repo_info(self, repo_name: str, org_name: Optional[str] = None) -> Dict[str, Any]:
+    def get_repo_info(self, repo_name: str, org_name: Optional[str] = None,
+                      refresh: bool = False) -> Dict[str, Any]:
         """
         Obtiene información de un repositorio específico.
         
+        El resultado se cachea por nombre completo (org/repo); los errores
+        (p. ej. repositorio inexistente) no se cachean.
+        
         Args:
             repo_name: Nombre del repositorio (puede incluir org/repo)
             org_name: Nombre de la organización (si repo_name no incluye org)
+            refresh: Si es True, ignora la caché y vuelve a consultar la API
             
         Returns:
             Diccionario con información del repositorio
         """
+        if "/" in repo_name:
+            full_name = repo_name
+        elif org_name:
+            full_name = f"{org_name}/{repo_name}"
+        else:
+            raise ValueError("Debe proporcionar org_name o usar formato org/repo")
+        
+        if not refresh and full_name in self._repo_info_cache:
+            return self._repo_info_cache[full_name]
+        
         try:
-            if "/" in repo_name:
-                repo = self.github.get_repo(repo_name)
-            elif org_name:
-                repo = self.github.get_repo(f"{org_name}/{repo_name}")
-            else:
-                raise ValueError("Debe proporcionar org_name o usar formato org/repo")
+            repo = self.github.get_repo(full_name)
             
-            return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "url": repo.html_url,
-                "clone_url": repo.clone_url,
-                "default_branch": repo.default_branch,
-                "private": repo.private,
-                "description": repo.description,
-                "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-            }
+            info = self._repo_info(repo)
+            self._repo_info_cache[full_name] = info
+            return info
         except GithubException as e:
             raise Exception(f"Error al obtener información del repositorio {repo_name}: {e}")
     
+    def _repo_info(self, repo) -> Dict[str, Any]:
+        """
+        Construye el diccionario que devuelve get_repo_info.
+        
+        Args:
+            repo: Objeto Repository de PyGithub
+            
+        Returns:
+            Diccionario con información del repositorio
+        """
+        return {
+            "name": repo.name,
+            "full_name": repo.full_name,
+            "url": repo.html_url,
+            "clone_url": repo.clone_url,
+            "default_branch": repo.default_branch,
+            "private": repo.private,
+            "description": repo.description,
+            "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
+        }
+    
     def create_repo(self, name: str, org_name: Optional[str] = None, 
                    description: str = "", private: bool = False) -> Dict[str, Any]:
         """
@@ -110,6 +164,12 @@ class GitHubClient:
                     auto_init=False
                 )
             
+            # La respuesta de creación trae todos los campos: se cachea con el
+            # mismo formato que get_repo_info, sin otra petición
+            self._repo_info_cache[repo.full_name] = self._repo_info(repo)
+            # El listado de la organización cacheado ya no está completo
+            if org_name:
+                self._org_repos_cache.pop(org_name, None)
             return {
                 "name": repo.name,
                 "full_name": repo.full_name,
@@ -1,10 +1,149 @@
 """Utilidades compartidas para los agentes."""
 
+import asyncio
+import fnmatch
+import os
+import socket
 import subprocess
 import sys
 import logging
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import AbstractSet, Iterator, Optional, Tuple, List
+
+
+# Directorios pesados que nunca contienen archivos relevantes para los agentes
+SKIP_DIRS = {"node_modules", ".git", "dist", "build", ".next", "target", "__pycache__", ".venv", "vendor"}
+
+# Tamaño máximo (caracteres) y antigüedad máxima (segundos) de la salida de
+# log acumulada antes de escribirla
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.1
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler que agrupa los registros y los escribe en bloque.
+    
+    StreamHandler hace write + flush por cada registro; aquí los registros se
+    acumulan y se vuelcan al llegar a LOG_BUFFER_SIZE, tras LOG_FLUSH_INTERVAL
+    segundos o inmediatamente si son WARNING o superior. El volcado por tiempo
+    lo hace un único hilo daemon por handler, creado con el primer registro
+    acumulado y reutilizado durante toda la ejecución. logging.shutdown
+    (registrado con atexit) vuelca lo pendiente al salir, y los agentes
+    llaman a flush_logging al terminar run().
+    """
+    
+    def __init__(self, stream=None, buffer_size: int = LOG_BUFFER_SIZE,
+                 flush_interval: float = LOG_FLUSH_INTERVAL):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._pending: List[str] = []
+        self._pending_size = 0
+        # Se activa cuando hay registros pendientes; el hilo de volcado la espera
+        self._has_pending = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        # Último registro acumulado, para informar de errores al volcar
+        self._last_record: Optional[logging.LogRecord] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # emit se llama con self.lock adquirido (Handler.handle). Los errores
+        # de escritura (p. ej. BrokenPipe con `agente | head`) se tratan como
+        # en StreamHandler.emit, sin llegar a quien registra el mensaje
+        try:
+            msg = self.format(record) + self.terminator
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            self._last_record = record
+            if record.levelno >= logging.WARNING or self._pending_size >= self.buffer_size:
+                self._write_pending()
+            elif not self._has_pending.is_set():
+                self._has_pending.set()
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_periodically, name="log-flusher", daemon=True
+                    )
+                    self._flusher.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _write_pending(self) -> None:
+        """Escribe lo acumulado; debe llamarse con self.lock adquirido."""
+        self._has_pending.clear()
+        if self._pending:
+            data = "".join(self._pending)
+            self._pending.clear()
+            self._pending_size = 0
+            self.stream.write(data)
+        if self.stream and hasattr(self.stream, "flush"):
+            self.stream.flush()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+    
+    def _flush_periodically(self) -> None:
+        """Bucle del hilo de volcado: vuelca lo pendiente flush_interval segundos después de que llegue."""
+        while True:
+            self._has_pending.wait()
+            time.sleep(self.flush_interval)
+            # Sin propagar errores: terminarían con el hilo y no habría más volcados
+            try:
+                self.flush()
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(self._last_record)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter que reutiliza el texto de la fecha entre registros del mismo segundo.
+    
+    logging.Formatter llama a time.strftime por cada registro; con muchas líneas
+    por segundo casi siempre produce el mismo texto. El formato resultante es
+    idéntico al de logging.Formatter.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (segundo, texto formateado); se reemplaza como tupla, sin estados intermedios
+        self._cached_time = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+def flush_logging() -> None:
+    """
+    Vuelca la salida de log pendiente de los agentes.
+    
+    Necesario antes de lanzar un proceso que escribe directamente en la
+    terminal, para que el orden de la salida se mantenga.
+    """
+    for handler in logging.getLogger("project_management_agents").handlers:
+        # Igual que logging.shutdown: un stream cerrado o roto no es un error
+        # de quien vuelca el log
+        try:
+            handler.flush()
+        except (OSError, ValueError):
+            pass
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -20,20 +159,33 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger("project_management_agents")
     logger.setLevel(level)
     
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(level)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    # Ya configurado: no volver a agregar handlers en cada agente instanciado,
+    # pero sí aplicar el nivel pedido (p. ej. --verbose en una segunda llamada)
+    if logger.handlers:
+        for existing in logger.handlers:
+            existing.setLevel(level)
+        return logger
+    
+    handler = BufferedStreamHandler(sys.stdout)
+    handler.setLevel(level)
+    formatter = CachedTimeFormatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
     
     return logger
 
 
+def _read_tmpfile(tmp_file) -> str:
+    """Lee desde el inicio un archivo temporal usado para capturar salida."""
+    tmp_file.seek(0)
+    return tmp_file.read().decode('utf-8')
+
+
 def run_command(command: List[str], cwd: Optional[Path] = None, 
-                check: bool = True, capture_output: bool = False) -> Tuple[int, str, str]:
+                check: bool = True, capture_output: bool = False,
+                capture_tmpfile: bool = False) -> Tuple[int, str, str]:
     """
     Ejecuta un comando en el shell.
     
@@ -42,6 +194,8 @@ def run_command(command: List[str], cwd: Optional[Path] = None,
         cwd: Directorio de trabajo
         check: Si es True, lanza excepción si el comando falla
         capture_output: Si es True, captura stdout y stderr
+        capture_tmpfile: Si es True, captura stdout y stderr en archivos
+                         temporales en vez de pipes (para comandos con mucha salida)
         
     Returns:
         Tupla con (returncode, stdout, stderr)
@@ -57,17 +211,34 @@ def run_command(command: List[str], cwd: Optional[Path] = None,
         cwd_str = str(cwd) if cwd else None
         logger.debug(f"Directorio de trabajo: {cwd_str}")
         
-        result = subprocess.run(
-            command,
-            cwd=cwd_str,
-            check=check,
-            capture_output=capture_output,
-            text=True,
-            encoding='utf-8'
-        )
-        
-        stdout = result.stdout if capture_output else ""
-        stderr = result.stderr if capture_output else ""
+        if capture_tmpfile:
+            # Con archivos temporales el proceso hijo nunca se bloquea esperando
+            # que se vacíe un pipe, lo que evita el vaivén entre procesos
+            with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+                result = subprocess.run(
+                    command,
+                    cwd=cwd_str,
+                    check=check,
+                    stdout=out_file,
+                    stderr=err_file
+                )
+                stdout = _read_tmpfile(out_file)
+                stderr = _read_tmpfile(err_file)
+        else:
+            if not capture_output:
+                # El comando escribe directo en la terminal
+                flush_logging()
+            result = subprocess.run(
+                command,
+                cwd=cwd_str,
+                check=check,
+                capture_output=capture_output,
+                text=True,
+                encoding='utf-8'
+            )
+            
+            stdout = result.stdout if capture_output else ""
+            stderr = result.stderr if capture_output else ""
         
         if result.returncode != 0:
             logger.warning(f"Comando falló con código {result.returncode}")
@@ -83,28 +254,201 @@ def run_command(command: List[str], cwd: Optional[Path] = None,
         return e.returncode, e.stdout if hasattr(e, 'stdout') else "", e.stderr if hasattr(e, 'stderr') else ""
 
 
+async def run_command_async(command: List[str], cwd: Optional[Path] = None,
+                            check: bool = True, capture_output: bool = False,
+                            capture_tmpfile: bool = False) -> Tuple[int, str, str]:
+    """
+    Ejecuta un comando sin bloquear el event loop.
+    
+    Versión asíncrona de run_command, para solapar comandos independientes.
+    
+    Args:
+        command: Lista con el comando y sus argumentos
+        cwd: Directorio de trabajo
+        check: Si es True, lanza excepción si el comando falla
+        capture_output: Si es True, captura stdout y stderr
+        capture_tmpfile: Si es True, captura stdout y stderr en archivos
+                         temporales en vez de pipes (para comandos con mucha salida)
+        
+    Returns:
+        Tupla con (returncode, stdout, stderr)
+        
+    Raises:
+        subprocess.CalledProcessError: Si check=True y el comando falla
+    """
+    logger = logging.getLogger("project_management_agents")
+    logger.debug(f"Ejecutando comando: {' '.join(command)}")
+    
+    cwd_str = str(cwd) if cwd else None
+    logger.debug(f"Directorio de trabajo: {cwd_str}")
+    
+    if capture_tmpfile:
+        with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd_str,
+                stdout=out_file,
+                stderr=err_file
+            )
+            await process.wait()
+            stdout = _read_tmpfile(out_file)
+            stderr = _read_tmpfile(err_file)
+    else:
+        pipe = asyncio.subprocess.PIPE if capture_output else None
+        if not capture_output:
+            # El comando escribe directo en la terminal
+            flush_logging()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=cwd_str,
+            stdout=pipe,
+            stderr=pipe
+        )
+        out, err = await process.communicate()
+        
+        stdout = out.decode('utf-8') if out else ""
+        stderr = err.decode('utf-8') if err else ""
+    
+    if process.returncode != 0:
+        if check:
+            logger.error(f"Error al ejecutar comando: {' '.join(command)}")
+            raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+        logger.warning(f"Comando falló con código {process.returncode}")
+        if stderr:
+            logger.warning(f"stderr: {stderr}")
+    
+    return process.returncode, stdout, stderr
+
+
+def _docker_socket_paths() -> List[str]:
+    """
+    Obtiene las rutas candidatas del socket Unix del daemon de Docker.
+    
+    Returns:
+        Lista de rutas; vacía si DOCKER_HOST apunta a un daemon no local
+    """
+    docker_host = os.getenv("DOCKER_HOST", "")
+    if docker_host:
+        if docker_host.startswith("unix://"):
+            return [docker_host[len("unix://"):]]
+        return []
+    # Linux y macOS (Docker Desktop)
+    return ["/var/run/docker.sock", os.path.expanduser("~/.docker/run/docker.sock")]
+
+
+def _probe_docker_socket() -> Optional[bool]:
+    """
+    Comprueba si el daemon de Docker responde en su socket Unix.
+    
+    Un connect no basta: el proxy del socket de Docker Desktop acepta
+    conexiones antes de que el motor esté listo, así que se pide GET /_ping
+    y se exige la respuesta "OK".
+    
+    Returns:
+        True si el daemon responde OK, False si responde otra cosa, o None si
+        ningún socket contesta (en ese caso hay que usar 'docker info')
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    
+    for path in _docker_socket_paths():
+        if not os.path.exists(path):
+            continue
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(1.0)
+        try:
+            sock.connect(path)
+            sock.sendall(b"GET /_ping HTTP/1.0\r\nHost: docker\r\n\r\n")
+            response = b""
+            while len(response) < 4096:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+        except OSError:
+            # Socket obsoleto, sin permisos o sin respuesta: probar el siguiente
+            continue
+        finally:
+            sock.close()
+        
+        head, _, body = response.partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].split()
+        return len(status_line) >= 2 and status_line[1] == b"200" and body.strip() == b"OK"
+    
+    return None
+
+
 def check_docker_running() -> bool:
     """
     Verifica si Docker está corriendo.
     
+    Prueba primero el socket del daemon (un GET /_ping en vez de lanzar un
+    proceso) y solo recurre a 'docker info' si ningún socket local responde.
+    
     Returns:
         True si Docker está corriendo, False en caso contrario
     """
     logger = logging.getLogger("project_management_agents")
-    try:
-        returncode, _, _ = run_command(["docker", "info"], check=False, capture_output=True)
-        if returncode == 0:
-            logger.info("Docker está corriendo")
-            return True
-        else:
-            logger.warning("Docker no está corriendo")
+    running = _probe_docker_socket()
+    if running is None:
+        try:
+            # La salida se descarta: DEVNULL evita crear pipes y leerlos
+            result = subprocess.run(
+                ["docker", "info"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+            running = result.returncode == 0
+        except FileNotFoundError:
+            logger.error("Docker no está instalado o no está en el PATH")
             return False
-    except FileNotFoundError:
-        logger.error("Docker no está instalado o no está en el PATH")
+    
+    if running:
+        logger.info("Docker está corriendo")
+        return True
+    else:
+        logger.warning("Docker no está corriendo")
         return False
 
 
-def find_files(pattern: str, root_dir: Path, recursive: bool = True) -> List[Path]:
+def iter_files(pattern: str, root_dir: Path,
+               exclude_dirs: Optional[AbstractSet[str]] = None) -> Iterator[str]:
+    """
+    Recorre recursivamente un árbol y devuelve las rutas que coinciden con un patrón.
+    
+    Recorrido iterativo con os.scandir: DirEntry cachea el tipo de entrada,
+    evitando un stat por archivo, y solo se devuelven strings (sin crear un
+    Path por entrada). Al ser un generador, quien solo necesita saber si hay
+    alguna coincidencia puede cortar el recorrido en la primera.
+    
+    Args:
+        pattern: Patrón de búsqueda sobre el nombre (ej: "*postman*.json")
+        root_dir: Directorio raíz para buscar
+        exclude_dirs: Nombres de directorios que no se recorren (por defecto SKIP_DIRS)
+        
+    Yields:
+        Ruta (str) de cada entrada que coincide con el patrón
+    """
+    if exclude_dirs is None:
+        exclude_dirs = SKIP_DIRS
+    
+    pending = [os.fspath(root_dir)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if fnmatch.fnmatchcase(entry.name, pattern):
+                        yield entry.path
+                    if entry.is_dir(follow_symlinks=False) and entry.name not in exclude_dirs:
+                        pending.append(entry.path)
+        except OSError:
+            continue
+
+
+def find_files(pattern: str, root_dir: Path, recursive: bool = True,
+               exclude_dirs: Optional[AbstractSet[str]] = None) -> List[Path]:
     """
     Busca archivos que coincidan con un patrón.
     
@@ -112,14 +456,16 @@ def find_files(pattern: str, root_dir: Path, recursive: bool = True) -> List[Pat
         pattern: Patrón de búsqueda (ej: "*.json", "*postman*.json")
         root_dir: Directorio raíz para buscar
         recursive: Si es True, busca recursivamente
+        exclude_dirs: Nombres de directorios que no se recorren en la búsqueda
+                      recursiva (por defecto SKIP_DIRS)
         
     Returns:
         Lista de Paths que coinciden con el patrón
     """
-    if recursive:
-        return list(root_dir.rglob(pattern))
-    else:
+    if not recursive:
         return list(root_dir.glob(pattern))
+    
+    return [Path(path) for path in iter_files(pattern, root_dir, exclude_dirs)]
 
 
 def ensure_dir(path: Path) -> Path:
@@ -0,0 +1,32 @@
+"""Pruebas del análisis de la salida de make en el agente start_project."""
+
+import pytest
+
+from agents.start_project.start_project_agent import _failed_make_target
+
+
+@pytest.mark.parametrize("stderr, expected", [
+    # GNU make 3.x
+    ("make: *** [lite-start] Error 1\n", "lite-start"),
+    # GNU make 4.x incluye archivo y línea
+    ("make: *** [Makefile:12: frontend-all] Error 2\n", "frontend-all"),
+    # Un sub-make falla dentro de la receta: cuenta el objetivo de nivel superior
+    ("make[1]: *** [Makefile:5: build-admin] Error 1\n"
+     "make: *** [Makefile:40: frontend-all] Error 2\n", "frontend-all"),
+    # El objetivo no existe en el Makefile
+    ("make: *** No rule to make target 'frontend-all'.  Stop.\n", "frontend-all"),
+    ("make: *** No rule to make target `lite-start'.  Stop.\n", "lite-start"),
+    # Falta una dependencia de un objetivo conocido
+    ("make: *** No rule to make target 'admin', needed by 'frontend-all'.  Stop.\n", "frontend-all"),
+])
+def test_failed_target_is_identified(stderr, expected):
+    assert _failed_make_target(stderr) == expected
+
+
+@pytest.mark.parametrize("stderr", [
+    # Falla la receta de una dependencia: no se sabe de qué objetivo
+    "make: *** [Makefile:3: docker-up] Error 1\n",
+    "",
+])
+def test_unattributable_failure_is_unknown(stderr):
+    assert _failed_make_target(stderr) is None
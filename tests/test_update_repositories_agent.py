@@ -0,0 +1,135 @@
+"""Pruebas del análisis de la salida de git en el agente update_repositories."""
+
+import logging
+import subprocess
+
+import pytest
+
+from agents.update_repositories.update_repositories_agent import UpdateRepositoriesAgent
+
+
+class FakeGit:
+    """Sustituto de repo.git que devuelve una salida fija de git status."""
+
+    def __init__(self, status_output):
+        self.status_output = status_output
+
+    def status(self, *args):
+        return self.status_output
+
+
+class FakeRepo:
+    def __init__(self, status_output):
+        self.git = FakeGit(status_output)
+
+
+@pytest.fixture
+def agent():
+    # Sin __init__: estos métodos no usan configuración ni clientes
+    agent = UpdateRepositoriesAgent.__new__(UpdateRepositoriesAgent)
+    agent.logger = logging.getLogger("project_management_agents")
+    return agent
+
+
+def parse(agent, *lines):
+    return agent._parse_porcelain_v2(FakeRepo("\n".join(lines)))
+
+
+def test_clean_branch_with_upstream(agent):
+    parsed = parse(
+        agent,
+        "# branch.oid 0123456789abcdef0123456789abcdef01234567",
+        "# branch.head main",
+        "# branch.upstream origin/main",
+        "# branch.ab +2 -3",
+    )
+    assert parsed == {
+        "branch": "main",
+        "is_dirty": False,
+        "untracked_files": 0,
+        "has_conflicts": False,
+        "ahead": 2,
+        "behind": 3,
+    }
+
+
+def test_initial_commit_without_upstream(agent):
+    parsed = parse(
+        agent,
+        "# branch.oid (initial)",
+        "# branch.head main",
+        "? nuevo.txt",
+    )
+    assert parsed["branch"] == "main"
+    assert parsed["untracked_files"] == 1
+    assert not parsed["is_dirty"]
+    # Sin upstream no hay branch.ab: get_repo_status compara contra origin/<branch>
+    assert "ahead" not in parsed and "behind" not in parsed
+
+
+def test_detached_head_keeps_unknown_branch(agent):
+    parsed = parse(agent, "# branch.oid 0123456789abcdef0123456789abcdef01234567", "# branch.head (detached)")
+    assert parsed["branch"] == "unknown"
+
+
+def test_changed_renamed_and_untracked_entries(agent):
+    parsed = parse(
+        agent,
+        "# branch.head main",
+        "1 .M N... 100644 100644 100644 0123456 0123456 modificado.txt",
+        "2 R. N... 100644 100644 100644 0123456 0123456 R100 nuevo.txt\tviejo.txt",
+        "? a.txt",
+        "? b.txt",
+    )
+    assert parsed["is_dirty"]
+    assert parsed["untracked_files"] == 2
+    assert not parsed["has_conflicts"]
+
+
+def test_unmerged_entry_is_a_conflict(agent):
+    parsed = parse(
+        agent,
+        "# branch.head main",
+        "u UU N... 100644 100644 100644 100644 0123456 0123456 0123456 conflicto.txt",
+    )
+    assert parsed["has_conflicts"]
+    assert parsed["is_dirty"]
+
+
+def git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True
+    )
+
+
+def commit(cwd, message):
+    git(cwd, "commit", "--allow-empty", "-q", "-m", message)
+
+
+def test_count_ahead_behind_against_origin(agent, tmp_path):
+    git_module = pytest.importorskip("git")
+
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    git(origin, "init", "-q", "-b", "main")
+    commit(origin, "base")
+    git(tmp_path, "clone", "-q", str(origin), "clone")
+    clone = tmp_path / "clone"
+
+    commit(clone, "local 1")
+    commit(clone, "local 2")
+    commit(origin, "remoto")
+    git(clone, "fetch", "-q")
+
+    repo = git_module.Repo(clone)
+    assert agent._count_ahead_behind(repo, "main") == (2, 1)
+
+
+def test_count_ahead_behind_without_remote(agent, tmp_path):
+    git_module = pytest.importorskip("git")
+
+    git(tmp_path, "init", "-q", "-b", "main")
+    commit(tmp_path, "base")
+
+    assert agent._count_ahead_behind(git_module.Repo(tmp_path), "main") == (0, 0)